@@ -1,8 +1,16 @@
+from concurrent.futures import ThreadPoolExecutor
+
 from .tools import all_tools
 
 if __name__ == "__main__":
-    for tool in all_tools:
+    # Materialize the Pydantic schema introspection for all tools
+    # concurrently, then print in the original order.
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        rows = list(
+            executor.map(lambda tool: (tool, tool.args, tool.description), all_tools)
+        )
+    for tool, args, description in rows:
         print(f"Tool: {tool}")
-        print(f"Args: {tool.args}")
-        print(f"Description: {tool.description}")
+        print(f"Args: {args}")
+        print(f"Description: {description}")
         print("-" * 100)
@@ -1,28 +1,355 @@
+import asyncio
+import io
+import json
+import re
+import time
 from argparse import Namespace
+from functools import lru_cache
 
+import httpx
 from langchain.agents import create_agent
-from langchain.agents.middleware import LLMToolSelectorMiddleware, TodoListMiddleware
+from langchain.agents.middleware import (
+    AgentMiddleware,
+    LLMToolSelectorMiddleware,
+    TodoListMiddleware,
+)
+from langchain_core.caches import InMemoryCache
+from langchain_core.globals import set_llm_cache
+from langchain_core.messages import HumanMessage
 from langchain_openai import ChatOpenAI
+from openai import OpenAI
 
-from open_claude_for_excel.tools import all_tools
+from open_claude_for_excel.tools import (
+    ALL_TOOLS_BY_NAME,
+    TOOL_ADAPTERS,
+    TOOL_OPENAI_SCHEMAS,
+    all_tools,
+    match_tool_groups,
+)
 
+# Shared HTTP connection pools so repeated agent/session creation reuses
+# keep-alive connections instead of paying a new TCP+TLS handshake each time.
+_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=32, max_connections=64)
+_HTTP_CLIENT = httpx.Client(limits=_HTTP_LIMITS, timeout=60)
+_HTTP_ASYNC_CLIENT = httpx.AsyncClient(limits=_HTTP_LIMITS, timeout=60)
 
-def create_excel_agent(args: Namespace):
-    model = ChatOpenAI(
-        model=args.default_model,
+
+# Excel agent prompts are highly repetitive ("sum column B", "make a pivot
+# of Sheet1"), so cached completions frequently replace a full LLM call.
+LLM_CACHE_PATH = ".excel_agent_cache.db"
+
+
+@lru_cache(maxsize=None)
+def _configure_llm_cache() -> None:
+    """Install a process-wide LLM cache so repeated prompts skip the API.
+
+    Uses the persistent SQLite cache when langchain-community is installed
+    and falls back to an in-memory cache otherwise.
+    """
+    try:
+        from langchain_community.cache import SQLiteCache
+    except ImportError:
+        set_llm_cache(InMemoryCache())
+    else:
+        set_llm_cache(SQLiteCache(database_path=LLM_CACHE_PATH))
+
+
+@lru_cache(maxsize=8)
+def _get_model(
+    model: str,
+    api_key: str | None,
+    base_url: str | None,
+    service_tier: str | None = None,
+) -> ChatOpenAI:
+    """Return a shared ChatOpenAI client bound to the pooled HTTP clients."""
+    return ChatOpenAI(
+        model=model,
+        api_key=api_key,
+        base_url=base_url,
+        temperature=0.5,
+        streaming=True,
+        stream_usage=True,
+        service_tier=service_tier,
+        http_client=_HTTP_CLIENT,
+        http_async_client=_HTTP_ASYNC_CLIENT,
+    )
+
+
+def _latest_user_text(messages) -> str:
+    """Extract the text of the most recent user message."""
+    for message in reversed(messages):
+        if isinstance(message, HumanMessage):
+            content = message.content
+            if isinstance(content, str):
+                return content
+            return " ".join(
+                part.get("text", "")
+                for part in content
+                if isinstance(part, dict)
+            )
+    return ""
+
+
+# One-shot queries ("read A1:C10") gain nothing from the todo-list planning
+# step; a short imperative request for a single operation is answered in one
+# tool round-trip instead of 2-3 planning turns.
+_SIMPLE_QUERY_RE = re.compile(
+    r"^\s*(read|get|show|list|validate|check|rename|delete|merge|unmerge)\b",
+    re.IGNORECASE,
+)
+_SIMPLE_QUERY_MAX_CHARS = 120
+
+
+def _is_simple_query(query: str) -> bool:
+    """Classify queries that a single tool call can satisfy."""
+    return (
+        0 < len(query) <= _SIMPLE_QUERY_MAX_CHARS
+        and _SIMPLE_QUERY_RE.match(query) is not None
+    )
+
+
+class SimpleQueryFastPathMiddleware(AgentMiddleware):
+    """Bypass todo-list planning for simple one-shot queries.
+
+    When the latest user message classifies as simple, the planning tool
+    registered by TodoListMiddleware is dropped from the request so the
+    model goes straight to the Excel tool call.
+    """
+
+    def _narrow(self, request):
+        if not _is_simple_query(_latest_user_text(request.messages)):
+            return request
+        tools = [
+            request_tool
+            for request_tool in request.tools
+            if getattr(request_tool, "name", None) != "write_todos"
+        ]
+        return request.override(tools=tools)
+
+    def wrap_model_call(self, request, handler):
+        return handler(self._narrow(request))
+
+    async def awrap_model_call(self, request, handler):
+        return await handler(self._narrow(request))
+
+
+class ToolGroupRouterMiddleware(AgentMiddleware):
+    """Narrow the tool list per turn with static keyword routing.
+
+    Scans the latest user message against the keyword table in
+    `tools.GROUP_KEYWORDS` and restricts the request to the matched tool
+    groups, skipping the tool-selector LLM round-trip. When no keyword
+    matches (or only weak ones, like a bare filename, do) the request
+    falls through to the LLM tool selector.
+    """
+
+    def __init__(self, fallback: LLMToolSelectorMiddleware):
+        super().__init__()
+        self._fallback = fallback
+        self._excel_tool_names = {excel_tool.name for excel_tool in all_tools}
+
+    def _route(self, request):
+        """Return the narrowed request, or None if routing did not match."""
+        matched = match_tool_groups(_latest_user_text(request.messages))
+        if not matched:
+            return None
+        matched_names = {excel_tool.name for excel_tool in matched}
+        # Keep middleware-provided tools (e.g. the todo list) untouched and
+        # narrow only the Excel tools.
+        tools = [
+            request_tool
+            for request_tool in request.tools
+            if getattr(request_tool, "name", None) not in self._excel_tool_names
+            or request_tool.name in matched_names
+        ]
+        return request.override(tools=tools)
+
+    def wrap_model_call(self, request, handler):
+        routed = self._route(request)
+        if routed is not None:
+            return handler(routed)
+        return self._fallback.wrap_model_call(request, handler)
+
+    async def awrap_model_call(self, request, handler):
+        routed = self._route(request)
+        if routed is not None:
+            return await handler(routed)
+        return await self._fallback.awrap_model_call(request, handler)
+
+
+class ParallelToolCallsMiddleware(AgentMiddleware):
+    """Ask the model to emit independent tool calls in a single turn.
+
+    The tool node already executes all tool calls of one assistant message
+    concurrently, so opting into OpenAI's parallel tool calling is the only
+    missing piece for overlapping independent Excel operations.
+    """
+
+    @staticmethod
+    def _with_parallel_calls(request):
+        return request.override(
+            model_settings={"parallel_tool_calls": True, **request.model_settings}
+        )
+
+    def wrap_model_call(self, request, handler):
+        return handler(self._with_parallel_calls(request))
+
+    async def awrap_model_call(self, request, handler):
+        return await handler(self._with_parallel_calls(request))
+
+
+async def astream_agent_events(agent, user_input: str):
+    """Stream tool results and answer tokens as they become available.
+
+    Yields ("tool_result", output) as soon as each tool call finishes and
+    ("token", text) for every streamed chunk of the assistant message, so a
+    caller can print tool output immediately instead of waiting for the
+    final summary turn to complete. For many Excel queries the raw tool
+    output already is the answer.
+    """
+    inputs = {"messages": [HumanMessage(user_input)]}
+    async for event in agent.astream_events(inputs):
+        kind = event["event"]
+        if kind == "on_tool_end":
+            yield ("tool_result", event["data"].get("output"))
+        elif kind == "on_chat_model_stream":
+            chunk = event["data"].get("chunk")
+            text = getattr(chunk, "content", "")
+            if isinstance(text, str) and text:
+                yield ("token", text)
+
+
+class BatchProcessor:
+    """Run independent user prompts against one agent concurrently.
+
+    The legacy completions API accepts an array of prompts per request, but
+    the chat-completions models used here do not, so the equivalent saving
+    comes from issuing the independent requests concurrently over the shared
+    pooled HTTP client and demuxing results back to callers in input order.
+    """
+
+    def __init__(self, agent):
+        self._agent = agent
+
+    async def abatch(self, prompts: list[str]) -> list:
+        inputs = [{"messages": [HumanMessage(prompt)]} for prompt in prompts]
+        return await asyncio.gather(
+            *(self._agent.ainvoke(agent_input) for agent_input in inputs)
+        )
+
+    def batch(self, prompts: list[str]) -> list:
+        return asyncio.run(self.abatch(prompts))
+
+
+def _dispatch_tool_call(tool_call: dict) -> str:
+    """Run one Batch API tool call against the local Excel tools."""
+    function = tool_call["function"]
+    excel_tool = ALL_TOOLS_BY_NAME.get(function["name"])
+    if excel_tool is None:
+        return f"Error: unknown tool '{function['name']}'"
+    # Validate the model-provided JSON against the precompiled adapter and
+    # call the implementation directly, skipping a second schema derivation.
+    adapter = TOOL_ADAPTERS[function["name"]]
+    validated = adapter.validate_python(json.loads(function["arguments"]))
+    return excel_tool.func(**dict(validated))
+
+
+def create_excel_batch_agent(
+    args: Namespace,
+    jobs: list[dict],
+    poll_interval: float = 10.0,
+    max_poll_interval: float = 300.0,
+) -> dict:
+    """Process non-interactive bulk Excel jobs through the OpenAI Batch API.
+
+    Each job is a dict with a unique "custom_id" and a "prompt". Jobs are
+    serialized to a JSONL batch against /v1/chat/completions (about half the
+    price of the synchronous API and exempt from its rate limits), the batch
+    is polled with exponential backoff, and each completed line's tool calls
+    are dispatched to the local Excel tools. Tool code is fully shared with
+    the interactive agent; only the transport differs.
+
+    Returns a mapping of custom_id to {"content", "tool_results"}.
+    """
+    client = OpenAI(
         api_key=args.openai_api_key,
         base_url=args.openai_base_url,
-        temperature=0.5,
+        http_client=_HTTP_CLIENT,
+    )
+
+    lines = [
+        json.dumps(
+            {
+                "custom_id": job["custom_id"],
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": args.default_model,
+                    "messages": [{"role": "user", "content": job["prompt"]}],
+                    "tools": list(TOOL_OPENAI_SCHEMAS),
+                },
+            }
+        )
+        for job in jobs
+    ]
+    # The Batch API rejects uploads without a .jsonl filename, and a bare
+    # BytesIO uploads as "upload", so name the in-memory file explicitly.
+    batch_file = client.files.create(
+        file=("batch.jsonl", io.BytesIO("\n".join(lines).encode())),
+        purpose="batch",
+    )
+    batch = client.batches.create(
+        input_file_id=batch_file.id,
+        endpoint="/v1/chat/completions",
+        completion_window="24h",
+    )
+
+    delay = poll_interval
+    while batch.status not in ("completed", "failed", "expired", "cancelled"):
+        time.sleep(delay)
+        delay = min(delay * 2, max_poll_interval)
+        batch = client.batches.retrieve(batch.id)
+    if batch.status != "completed":
+        raise RuntimeError(f"Batch {batch.id} finished with status '{batch.status}'")
+
+    results = {}
+    for line in client.files.content(batch.output_file_id).text.splitlines():
+        entry = json.loads(line)
+        message = entry["response"]["body"]["choices"][0]["message"]
+        results[entry["custom_id"]] = {
+            "content": message.get("content"),
+            "tool_results": [
+                _dispatch_tool_call(tool_call)
+                for tool_call in message.get("tool_calls") or []
+            ],
+        }
+    return results
+
+
+def create_excel_agent(args: Namespace):
+    _configure_llm_cache()
+    # Opt into the provider's latency-optimized tier (e.g. "priority" on
+    # OpenAI) when requested; the default tier is used otherwise.
+    latency_tier = getattr(args, "latency_tier", None)
+    model = _get_model(
+        args.default_model,
+        args.openai_api_key,
+        args.openai_base_url,
+        service_tier=latency_tier,
     )
     agent = create_agent(
         model,
         tools=all_tools,
         middleware=[
             TodoListMiddleware(),
-            LLMToolSelectorMiddleware(
-                model=model,
-                max_tools=5,
+            SimpleQueryFastPathMiddleware(),
+            ToolGroupRouterMiddleware(
+                fallback=LLMToolSelectorMiddleware(
+                    model=model,
+                    max_tools=5,
+                ),
             ),
+            ParallelToolCallsMiddleware(),
         ],
     )
     return agent
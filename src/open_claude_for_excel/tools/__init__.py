@@ -1,37 +1,48 @@
-from .tools import (
-    apply_formula,
-    copy_range,
-    copy_worksheet,
-    create_chart,
-    create_pivot_table,
-    create_table,
-    create_workbook,
-    create_worksheet,
-    delete_range,
-    delete_sheet_columns,
-    delete_sheet_rows,
-    delete_worksheet,
-    format_range,
-    get_data_validation_info,
-    get_merged_cells,
-    get_workbook_metadata,
-    insert_columns,
-    insert_rows,
-    merge_cells,
-    read_data_from_excel,
-    rename_worksheet,
-    unmerge_cells,
-    validate_excel_range,
-    validate_formula_syntax,
-    write_data_to_excel,
-)
+"""Lazily exported Excel tools.
+
+Importing this package is cheap: the tool implementations (and their
+openpyxl/langchain dependency chain) are only loaded on first attribute
+access via PEP 562, which keeps cold-start fast for invocations that never
+touch a workbook. Resolved attributes are cached in the module globals, so
+the lazy lookup is a one-time cost.
+"""
+
+import asyncio
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from importlib import import_module
+from itertools import chain
+
+_TOOLS_MODULE = "open_claude_for_excel.tools.tools"
+
+# Bounded worker pool shared by all async tool invocations. openpyxl is
+# blocking, so running tools here keeps the event loop free and lets the
+# tool calls of one agent turn overlap on file I/O.
+_POOL = ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4))
+
+
+def _add_async_support(excel_tool):
+    """Give a sync tool an async path that runs on the shared worker pool."""
+    func = excel_tool.func
+
+    async def _arun(**kwargs):
+        return await asyncio.get_running_loop().run_in_executor(
+            _POOL, partial(func, **kwargs)
+        )
+
+    excel_tool.coroutine = _arun
+    return excel_tool
 
 __all__ = [
     "apply_formula",
     "validate_formula_syntax",
     "format_range",
     "read_data_from_excel",
+    "read_many_ranges",
     "write_data_to_excel",
+    "batch_operations",
     "create_workbook",
     "create_worksheet",
     "create_chart",
@@ -54,37 +65,208 @@ __all__ = [
     "delete_sheet_columns",
 ]
 
-workbook_tools = [create_workbook, get_workbook_metadata, create_worksheet]
-data_tools = [write_data_to_excel, read_data_from_excel]
-formatting_tools = [format_range, merge_cells, unmerge_cells, get_merged_cells]
-formula_tools = [apply_formula, validate_formula_syntax]
-chart_tools = [create_chart]
-pivot_table_tools = [create_pivot_table]
-table_tools = [create_table]
-worksheet_tools = [delete_worksheet, rename_worksheet, copy_worksheet]
-range_tools = [
-    copy_range,
-    delete_range,
-    validate_excel_range,
-    get_data_validation_info,
-]
-row_column_tools = [
-    insert_rows,
-    insert_columns,
-    delete_sheet_rows,
-    delete_sheet_columns,
+# Tool group membership by name; the tool objects themselves are resolved
+# lazily on first access to the group attribute.
+_TOOL_GROUPS = {
+    "workbook_tools": (
+        "create_workbook",
+        "get_workbook_metadata",
+        "create_worksheet",
+    ),
+    "data_tools": (
+        "write_data_to_excel",
+        "read_data_from_excel",
+        "read_many_ranges",
+        "batch_operations",
+    ),
+    "formatting_tools": (
+        "format_range",
+        "merge_cells",
+        "unmerge_cells",
+        "get_merged_cells",
+    ),
+    "formula_tools": ("apply_formula", "validate_formula_syntax"),
+    "chart_tools": ("create_chart",),
+    "pivot_table_tools": ("create_pivot_table",),
+    "table_tools": ("create_table",),
+    "worksheet_tools": ("delete_worksheet", "rename_worksheet", "copy_worksheet"),
+    "range_tools": (
+        "copy_range",
+        "delete_range",
+        "validate_excel_range",
+        "get_data_validation_info",
+    ),
+    "row_column_tools": (
+        "insert_rows",
+        "insert_columns",
+        "delete_sheet_rows",
+        "delete_sheet_columns",
+    ),
+}
+
+# Keyword patterns for routing a user query to tool groups without an extra
+# LLM round-trip. Patterns are matched case-insensitively against the latest
+# user message; every group of every matching pattern is offered to the
+# model. Every keyword is anchored on a word boundary so a substring inside
+# an unrelated word ("sum" in "Summarize") cannot hijack the routing; stems
+# without a right boundary ("calculat", "delet") deliberately cover their
+# inflections. Ambiguous verbs map to all the groups they could mean: "copy"
+# and "delete" exist at sheet, range and row/column level, so restricting
+# them to one group would make the others unreachable for that turn.
+GROUP_KEYWORDS = {
+    r"\bworkbooks?\b|\bmetadata\b|\bnew file\b": ("workbook_tools",),
+    # A bare filename only says which file, not which operation, so it is
+    # offered broadly and counts as weak (see _WEAK_PATTERNS below).
+    r"\.xlsx\b": ("workbook_tools", "data_tools"),
+    r"\bread\b|\bwrite\b|\bdata\b|\bvalues?\b|\bcontents?\b": ("data_tools",),
+    r"\bformat|\bbold\b|\bitalic|\bunderlin|\bcolou?r|\bborder|\bfont|\balign|\bmerge": (
+        "formatting_tools",
+    ),
+    r"\bformulas?\b|\bsum\b|\baverage\b|\bcount\b|\bcalculat": ("formula_tools",),
+    r"\bcharts?\b|\bgraphs?\b|\bplot": ("chart_tools",),
+    r"\bpivot": ("pivot_table_tools",),
+    r"\btables?\b": ("table_tools",),
+    r"\bsheets?\b|\bworksheets?\b|\btabs?\b|\brenam": ("worksheet_tools",),
+    r"\bcopy\b|\bdelet|\bremov|\bclear\b": (
+        "worksheet_tools",
+        "range_tools",
+        "row_column_tools",
+    ),
+    r"\branges?\b|\bvalidat": ("range_tools",),
+    r"\brows?\b|\bcolumns?\b|\binsert": ("row_column_tools",),
+}
+
+# Patterns that hint at context rather than intent. A query matching only
+# weak patterns routes nowhere, so the caller falls back to the LLM tool
+# selector instead of the router guessing from a filename alone.
+_WEAK_PATTERNS = frozenset({r"\.xlsx\b"})
+
+_COMPILED_GROUP_KEYWORDS = [
+    (re.compile(pattern, re.IGNORECASE), group_names, pattern not in _WEAK_PATTERNS)
+    for pattern, group_names in GROUP_KEYWORDS.items()
 ]
 
 
-all_tools = (
-    workbook_tools
-    + data_tools
-    + formatting_tools
-    + formula_tools
-    + chart_tools
-    + pivot_table_tools
-    + table_tools
-    + worksheet_tools
-    + range_tools
-    + row_column_tools
+def _build_aggregate(name: str):
+    """Build the lazily exported aggregate attributes."""
+    if name == "all_tools":
+        # Frozen once on first access: the tool list never changes at
+        # runtime, and a tuple is hashable for use in cache keys.
+        return tuple(
+            chain.from_iterable(
+                __getattr__(group_name) for group_name in _TOOL_GROUPS
+            )
+        )
+    if name == "ALL_TOOLS_BY_NAME":
+        # O(1) lookup used when resolving tool calls by name.
+        return {excel_tool.name: excel_tool for excel_tool in __getattr__("all_tools")}
+    if name == "TOOL_ADAPTERS":
+        # Precompiled pydantic-core validators, built once per process.
+        # Validating model-provided JSON through these skips re-deriving
+        # the validator from each tool signature on every call.
+        from pydantic import TypeAdapter
+
+        return {
+            excel_tool.name: TypeAdapter(excel_tool.args_schema)
+            for excel_tool in __getattr__("all_tools")
+        }
+    if name == "TOOL_OPENAI_SCHEMAS":
+        # OpenAI function-calling schemas, serialized once per source
+        # revision. Callers that bind tools directly (e.g. batch
+        # transports) reuse these instead of re-deriving the JSON shape
+        # from each Pydantic schema; warm starts load the pickled dicts
+        # and skip the docstring-parsing/conversion work entirely.
+        cached = _load_schema_cache()
+        if cached is not None:
+            return cached
+
+        from langchain_core.utils.function_calling import convert_to_openai_tool
+
+        schemas = tuple(
+            convert_to_openai_tool(excel_tool)
+            for excel_tool in __getattr__("all_tools")
+        )
+        _store_schema_cache(schemas)
+        return schemas
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Schema cache lives next to the log file (see tools.py for the ROOT_DIR
+# rationale) and is keyed on a digest of the tool definitions, so edits to
+# tools.py invalidate it automatically.
+_SCHEMA_CACHE_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    ".tool_schema_cache.pkl",
 )
+
+
+def _tools_source_digest() -> str:
+    import hashlib
+
+    tools_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "tools.py")
+    with open(tools_path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def _load_schema_cache():
+    import pickle
+
+    try:
+        with open(_SCHEMA_CACHE_PATH, "rb") as f:
+            cached = pickle.load(f)
+        if cached.get("digest") == _tools_source_digest():
+            return cached["schemas"]
+    except (OSError, pickle.PickleError, AttributeError, KeyError, EOFError):
+        pass
+    return None
+
+
+def _store_schema_cache(schemas) -> None:
+    import pickle
+
+    try:
+        with open(_SCHEMA_CACHE_PATH, "wb") as f:
+            pickle.dump({"digest": _tools_source_digest(), "schemas": schemas}, f)
+    except OSError:
+        # Best effort: a read-only install just skips the warm-start cache.
+        pass
+
+
+def __getattr__(name: str):
+    if name in __all__:
+        value = _add_async_support(getattr(import_module(_TOOLS_MODULE), name))
+    elif name in _TOOL_GROUPS:
+        value = [
+            __getattr__(tool_name) for tool_name in _TOOL_GROUPS[name]
+        ]
+    else:
+        value = _build_aggregate(name)
+    globals()[name] = value
+    return value
+
+
+@lru_cache(maxsize=2048)
+def match_tool_groups(query: str) -> tuple:
+    """Return the union of tool groups whose keywords match the query.
+
+    Returns an empty tuple when no keyword matches — or when only weak
+    patterns do — in which case the caller should fall back to the full
+    tool list (or an LLM selector).
+
+    The keyword table and tool descriptions are static, so results are
+    memoized per query; agents repeating a prompt skip the regex scan.
+    """
+    matched = []
+    seen = set()
+    any_strong = False
+    for pattern, group_names, strong in _COMPILED_GROUP_KEYWORDS:
+        if pattern.search(query):
+            any_strong = any_strong or strong
+            for group_name in group_names:
+                for excel_tool in __getattr__(group_name):
+                    if excel_tool.name not in seen:
+                        seen.add(excel_tool.name)
+                        matched.append(excel_tool)
+    if not any_strong:
+        return ()
+    return tuple(matched)
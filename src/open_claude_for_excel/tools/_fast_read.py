@@ -0,0 +1,105 @@
+"""Optional Rust-backed fast path for read-only range access.
+
+python-calamine parses XLSX an order of magnitude faster than openpyxl
+and with a fraction of the peak memory, but it exposes plain cell values
+only. Read paths that do not need validation metadata route through
+here; when the library is not installed HAS_CALAMINE is False and
+callers fall back to the openpyxl readers.
+"""
+
+import logging
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from openpyxl.utils import get_column_letter
+
+from .cell_utils import parse_cell_range
+from .exceptions import DataError
+from .workbook_cache import flush_workbooks
+
+try:
+    from python_calamine import CalamineWorkbook
+except ImportError:
+    CalamineWorkbook = None
+
+HAS_CALAMINE = CalamineWorkbook is not None
+
+logger = logging.getLogger(__name__)
+
+
+def read_range(
+    filepath: Path | str,
+    sheet_name: str,
+    start_cell: str = "A1",
+    end_cell: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Read a range with calamine, mirroring the openpyxl reader's shape.
+
+    Returns the same columnar structure as read_excel_range_with_metadata
+    (parallel "addresses"/"values"/"rows"/"columns" lists) but without the
+    validation fields, which calamine does not parse. Keeping the shapes
+    identical means the tool's wire format does not depend on whether the
+    optional dependency is installed.
+    """
+    try:
+        # This path reads the file directly, so make sure any deferred
+        # workbook save has landed on disk first.
+        flush_workbooks(filepath)
+        wb = CalamineWorkbook.from_path(str(filepath))
+        if sheet_name not in wb.sheet_names:
+            raise DataError(f"Sheet '{sheet_name}' not found")
+        rows = wb.get_sheet_by_name(sheet_name).to_python(skip_empty_area=False)
+
+        # Parse start cell
+        if ":" in start_cell:
+            start_cell, end_cell = start_cell.split(":")
+        try:
+            start_row, start_col, end_row, end_col = parse_cell_range(
+                start_cell, end_cell
+            )
+        except ValueError as e:
+            raise DataError(f"Invalid cell range: {str(e)}")
+
+        max_row = len(rows)
+        max_col = max((len(row_values) for row_values in rows), default=0)
+
+        # If no end_cell, use the full data range of the sheet
+        if end_row is None or end_col is None:
+            end_row = max_row or start_row
+            end_col = max_col or start_col
+
+        # Validate range bounds
+        if start_row > max_row or start_col > max_col:
+            logger.warning(
+                f"Start cell {start_cell} is outside the sheet's data boundary. "
+                f"No data will be read."
+            )
+            return {"range": f"{start_cell}:", "sheet_name": sheet_name, "cells": []}
+
+        range_str = f"{get_column_letter(start_col)}{start_row}:{get_column_letter(end_col)}{end_row}"
+        addresses = []
+        values = []
+        out_rows = []
+        out_columns = []
+        for row in range(start_row, end_row + 1):
+            row_values = rows[row - 1] if row <= max_row else []
+            for col in range(start_col, end_col + 1):
+                addresses.append(f"{get_column_letter(col)}{row}")
+                values.append(row_values[col - 1] if col <= len(row_values) else None)
+                out_rows.append(row)
+                out_columns.append(col)
+        return {
+            "range": range_str,
+            "sheet_name": sheet_name,
+            "addresses": addresses,
+            "values": values,
+            "rows": out_rows,
+            "columns": out_columns,
+        }
+
+    except DataError as e:
+        logger.error(str(e))
+        raise
+    except Exception as e:
+        logger.error(f"Failed to read Excel range with calamine: {e}")
+        raise DataError(str(e))
@@ -0,0 +1,83 @@
+"""Process-pool fan-out for multi-sheet and multi-file range reads.
+
+openpyxl parsing is CPU-bound XML work, so reading several workbooks (or
+several sheets of large workbooks) scales near-linearly across worker
+processes. Requests are grouped per file and each file is handed to one
+worker task, so a workbook is parsed once no matter how many of its
+ranges were requested; inside the worker the shared handle cache serves
+every range of that file from the single parse.
+"""
+
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List
+
+logger = logging.getLogger(__name__)
+
+_pool: ProcessPoolExecutor | None = None
+_pool_lock = threading.Lock()
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    """Return the lazily created shared worker pool."""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                # By the time this pool is first used the process already
+                # runs the background writer and the tool worker threads;
+                # forking a threaded process can deadlock children on
+                # inherited locks, so start workers fresh via spawn.
+                _pool = ProcessPoolExecutor(
+                    max_workers=os.cpu_count(),
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+    return _pool
+
+
+def _read_file_ranges(
+    filepath: str, requests: List[Dict[str, Any]]
+) -> List[Dict[str, Any]]:
+    """Worker task: read all requested ranges of one file.
+
+    Runs in a separate process; per-request errors are returned inline so
+    one bad range does not fail the sibling requests of the batch.
+    """
+    from .data import read_excel_range_with_metadata
+
+    results = []
+    for request in requests:
+        try:
+            results.append(
+                read_excel_range_with_metadata(
+                    filepath,
+                    request["sheet_name"],
+                    request.get("start_cell", "A1"),
+                    request.get("end_cell"),
+                    include_validation=request.get("include_validation", True),
+                    columnar=True,
+                )
+            )
+        except Exception as e:
+            results.append(
+                {
+                    "sheet_name": request.get("sheet_name"),
+                    "error": str(e),
+                }
+            )
+    return results
+
+
+def read_ranges_parallel(
+    grouped: Dict[str, List[Dict[str, Any]]],
+) -> Dict[str, List[Dict[str, Any]]]:
+    """Fan grouped per-file range requests out across the process pool."""
+    pool = _get_pool()
+    futures = {
+        filepath: pool.submit(_read_file_ranges, filepath, requests)
+        for filepath, requests in grouped.items()
+    }
+    return {filepath: future.result() for filepath, future in futures.items()}
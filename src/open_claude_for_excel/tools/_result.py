@@ -0,0 +1,17 @@
+"""Slotted result type for mutating tool operations."""
+
+from dataclasses import dataclass
+
+
+@dataclass(slots=True, frozen=True)
+class ToolResult:
+    """Success payload returned by the mutating _impl functions.
+
+    A slotted dataclass instead of a ``{"message": ...}`` dict: attribute
+    access is a fixed offset rather than a hash probe, and each instance
+    is a fraction of a dict's size, which adds up over thousands of tool
+    calls. Operations with rich informational returns (validation,
+    metadata, reads) keep their dicts.
+    """
+
+    message: str
@@ -0,0 +1,116 @@
+"""Background writeback thread for workbook saves.
+
+Saving a workbook is zip compression plus a blocking disk write; the
+compression must happen on the mutating thread for a consistent
+snapshot, but the disk write does not. schedule_save() serializes the
+workbook to memory on the caller and hands the bytes to a daemon thread
+that performs the actual file write in large chunks, taking the write
+latency off the tool-call critical path. flush_all() is the correctness
+barrier: it blocks until every queued write has hit disk and is also
+registered atexit.
+"""
+
+import atexit
+import io
+import logging
+import os
+import queue
+import threading
+from typing import Callable, Optional
+
+from openpyxl import Workbook
+
+logger = logging.getLogger(__name__)
+
+_CHUNK_SIZE = 1 << 20  # 1 MiB writes keep syscall count low on big files
+
+_queue: (
+    "queue.Queue[tuple[str, bytes, Optional[Callable[[], None]],"
+    " Optional[Callable[[Exception], None]]]]"
+) = queue.Queue()
+_worker_lock = threading.Lock()
+_worker_started = False
+
+
+def _write_file(path: str, data: bytes) -> None:
+    # Write a sibling temp file and rename it into place: os.replace is
+    # atomic, so a concurrent reader sees either the previous file or the
+    # finished new one, never a truncated in-progress write.
+    tmp_path = f"{path}.tmp"
+    try:
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            view = memoryview(data)
+            while view:
+                written = os.write(fd, view[:_CHUNK_SIZE])
+                view = view[written:]
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _worker() -> None:
+    while True:
+        path, data, on_written, on_error = _queue.get()
+        try:
+            _write_file(path, data)
+        except Exception as exc:
+            logger.exception(f"Background save of {path} failed")
+            if on_error is not None:
+                try:
+                    on_error(exc)
+                except Exception:
+                    logger.exception(f"on_error callback for {path} failed")
+        else:
+            if on_written is not None:
+                try:
+                    on_written()
+                except Exception:
+                    logger.exception(f"on_written callback for {path} failed")
+        finally:
+            _queue.task_done()
+
+
+def _ensure_worker() -> None:
+    global _worker_started
+    if _worker_started:
+        return
+    with _worker_lock:
+        if not _worker_started:
+            threading.Thread(
+                target=_worker, name="workbook-writer", daemon=True
+            ).start()
+            _worker_started = True
+
+
+def schedule_save(
+    path: str,
+    wb: Workbook,
+    on_written: Optional[Callable[[], None]] = None,
+    on_error: Optional[Callable[[Exception], None]] = None,
+) -> None:
+    """Serialize the workbook now and queue the disk write.
+
+    The zip snapshot is taken on the calling thread, so later mutations
+    of the workbook cannot leak into this save. Exactly one of the
+    callbacks runs on the writer thread: on_written after the bytes are
+    on disk, on_error with the exception when the write failed.
+    """
+    buf = io.BytesIO()
+    wb.save(buf)
+    _ensure_worker()
+    _queue.put((os.fspath(path), buf.getvalue(), on_written, on_error))
+
+
+def flush_all() -> None:
+    """Block until every queued save has been written to disk."""
+    _queue.join()
+
+
+atexit.register(flush_all)
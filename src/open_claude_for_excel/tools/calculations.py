@@ -4,7 +4,7 @@ from typing import Any
 from .cell_utils import validate_cell_reference
 from .exceptions import CalculationError, ValidationError
 from .validation import validate_formula
-from .workbook import get_or_create_workbook
+from .workbook_cache import open_wb
 
 logger = logging.getLogger(__name__)
 
@@ -12,39 +12,50 @@ logger = logging.getLogger(__name__)
 def apply_formula(
     filepath: str, sheet_name: str, cell: str, formula: str
 ) -> dict[str, Any]:
-    """Apply any Excel formula to a cell."""
+    """Validate and apply any Excel formula to a cell."""
     try:
         if not validate_cell_reference(cell):
             raise ValidationError(f"Invalid cell reference: {cell}")
 
-        wb = get_or_create_workbook(filepath)
-        if sheet_name not in wb.sheetnames:
-            raise ValidationError(f"Sheet '{sheet_name}' not found")
-
-        sheet = wb[sheet_name]
-
         # Ensure formula starts with =
         if not formula.startswith("="):
             formula = f"={formula}"
 
-        # Validate formula syntax
+        # Validate formula syntax (memoized, so repeated edits of the same
+        # formula skip the parse)
         is_valid, message = validate_formula(formula)
         if not is_valid:
             raise CalculationError(f"Invalid formula syntax: {message}")
+    except (ValidationError, CalculationError) as e:
+        logger.error(str(e))
+        raise
+
+    return apply_formula_validated(filepath, sheet_name, cell, formula)
+
+
+def apply_formula_validated(
+    filepath: str, sheet_name: str, cell: str, formula: str
+) -> dict[str, Any]:
+    """Write an already-validated formula to a cell.
+
+    Callers are expected to have validated the cell reference and formula
+    syntax (apply_formula above, or validate_formula_syntax_only for the
+    tool layer), so this variant goes straight to the write instead of
+    parsing the formula a second time.
+    """
+    try:
+        if not formula.startswith("="):
+            formula = f"={formula}"
+
+        with open_wb(filepath, create=True) as wb:
+            if sheet_name not in wb.sheetnames:
+                raise ValidationError(f"Sheet '{sheet_name}' not found")
 
-        try:
-            # Apply formula to the cell
-            cell_obj = sheet[cell]
-            cell_obj.value = formula
-        except Exception as e:
-            raise CalculationError(f"Failed to apply formula to cell: {str(e)}")
-
-        try:
-            wb.save(filepath)
-        except Exception as e:
-            raise CalculationError(
-                f"Failed to save workbook after applying formula: {str(e)}"
-            )
+            try:
+                # Apply formula to the cell
+                wb[sheet_name][cell].value = formula
+            except Exception as e:
+                raise CalculationError(f"Failed to apply formula to cell: {str(e)}")
 
         return {
             "message": f"Applied formula '{formula}' to cell {cell}",
@@ -2,16 +2,22 @@ import logging
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-from openpyxl import load_workbook
 from openpyxl.utils import get_column_letter
 from openpyxl.worksheet.worksheet import Worksheet
 
+from ._fast_write import write_new_workbook
+from ._result import ToolResult
 from .cell_utils import parse_cell_range
 from .cell_validation import get_data_validation_for_cell
 from .exceptions import DataError
+from .workbook_cache import discard_workbook, open_wb, pending_writes, saves_deferred
 
 logger = logging.getLogger(__name__)
 
+# Payload size (in cells) above which a write into a brand-new file takes
+# the streaming write-only path instead of the cell-tree path.
+FAST_WRITE_CELL_THRESHOLD = 50_000
+
 
 def read_excel_range(
     filepath: Path | str,
@@ -22,71 +28,70 @@ def read_excel_range(
 ) -> List[Dict[str, Any]]:
     """Read data from Excel range with optional preview mode"""
     try:
-        wb = load_workbook(filepath, read_only=False)
+        with open_wb(filepath, mode="r") as wb:
 
-        if sheet_name not in wb.sheetnames:
-            raise DataError(f"Sheet '{sheet_name}' not found")
+            if sheet_name not in wb.sheetnames:
+                raise DataError(f"Sheet '{sheet_name}' not found")
 
-        ws = wb[sheet_name]
+            ws = wb[sheet_name]
 
-        # Parse start cell
-        if ":" in start_cell:
-            start_cell, end_cell = start_cell.split(":")
+            # Parse start cell
+            if ":" in start_cell:
+                start_cell, end_cell = start_cell.split(":")
 
-        # Get start coordinates
-        try:
-            start_coords = parse_cell_range(f"{start_cell}:{start_cell}")
-            if not start_coords or not all(
-                coord is not None for coord in start_coords[:2]
-            ):
-                raise DataError(f"Invalid start cell reference: {start_cell}")
-            start_row, start_col = start_coords[0], start_coords[1]
-        except ValueError as e:
-            raise DataError(f"Invalid start cell format: {str(e)}")
-
-        # Determine end coordinates
-        if end_cell:
+            # Get start coordinates
             try:
-                end_coords = parse_cell_range(f"{end_cell}:{end_cell}")
-                if not end_coords or not all(
-                    coord is not None for coord in end_coords[:2]
+                start_coords = parse_cell_range(f"{start_cell}:{start_cell}")
+                if not start_coords or not all(
+                    coord is not None for coord in start_coords[:2]
                 ):
-                    raise DataError(f"Invalid end cell reference: {end_cell}")
-                end_row, end_col = end_coords[0], end_coords[1]
+                    raise DataError(f"Invalid start cell reference: {start_cell}")
+                start_row, start_col = start_coords[0], start_coords[1]
             except ValueError as e:
-                raise DataError(f"Invalid end cell format: {str(e)}")
-        else:
-            # If no end_cell, use the full data range of the sheet
-            if ws.max_row == 1 and ws.max_column == 1 and ws.cell(1, 1).value is None:
-                # Handle empty sheet
-                end_row, end_col = start_row, start_col
+                raise DataError(f"Invalid start cell format: {str(e)}")
+
+            # Determine end coordinates
+            if end_cell:
+                try:
+                    end_coords = parse_cell_range(f"{end_cell}:{end_cell}")
+                    if not end_coords or not all(
+                        coord is not None for coord in end_coords[:2]
+                    ):
+                        raise DataError(f"Invalid end cell reference: {end_cell}")
+                    end_row, end_col = end_coords[0], end_coords[1]
+                except ValueError as e:
+                    raise DataError(f"Invalid end cell format: {str(e)}")
             else:
-                # Use the sheet's own boundaries
-                start_row, start_col = ws.min_row, ws.min_column
-                end_row, end_col = ws.max_row, ws.max_column
-
-        # Validate range bounds
-        if start_row > ws.max_row or start_col > ws.max_column:
-            # This case can happen if start_cell is outside the used area on a sheet with data
-            # or on a completely empty sheet.
-            logger.warning(
-                f"Start cell {start_cell} is outside the sheet's data boundary "
-                f"({get_column_letter(ws.min_column)}{ws.min_row}:{get_column_letter(ws.max_column)}{ws.max_row}). "
-                f"No data will be read."
-            )
-            return []
-
-        data = []
-        for row in range(start_row, end_row + 1):
-            row_data = []
-            for col in range(start_col, end_col + 1):
-                cell = ws.cell(row=row, column=col)
-                row_data.append(cell.value)
-            if any(v is not None for v in row_data):
-                data.append(row_data)
-
-        wb.close()
-        return data
+                # If no end_cell, use the full data range of the sheet
+                if ws.max_row == 1 and ws.max_column == 1 and ws.cell(1, 1).value is None:
+                    # Handle empty sheet
+                    end_row, end_col = start_row, start_col
+                else:
+                    # Use the sheet's own boundaries
+                    start_row, start_col = ws.min_row, ws.min_column
+                    end_row, end_col = ws.max_row, ws.max_column
+
+            # Validate range bounds
+            if start_row > ws.max_row or start_col > ws.max_column:
+                # This case can happen if start_cell is outside the used area on a sheet with data
+                # or on a completely empty sheet.
+                logger.warning(
+                    f"Start cell {start_cell} is outside the sheet's data boundary "
+                    f"({get_column_letter(ws.min_column)}{ws.min_row}:{get_column_letter(ws.max_column)}{ws.max_row}). "
+                    f"No data will be read."
+                )
+                return []
+
+            data = []
+            for row in range(start_row, end_row + 1):
+                row_data = []
+                for col in range(start_col, end_col + 1):
+                    cell = ws.cell(row=row, column=col)
+                    row_data.append(cell.value)
+                if any(v is not None for v in row_data):
+                    data.append(row_data)
+
+            return data
     except DataError as e:
         logger.error(str(e))
         raise
@@ -100,7 +105,7 @@ def write_data(
     sheet_name: Optional[str],
     data: Optional[List[List]],
     start_cell: str = "A1",
-) -> Dict[str, str]:
+) -> ToolResult:
     """Write data to Excel sheet with workbook handling
 
     Headers are handled intelligently based on context.
@@ -109,36 +114,55 @@ def write_data(
         if not data:
             raise DataError("No data provided to write")
 
-        wb = load_workbook(filepath)
-
-        # If no sheet specified, use active sheet
-        if not sheet_name:
-            active_sheet = wb.active
-            if active_sheet is None:
-                raise DataError("No active sheet found in workbook")
-            sheet_name = active_sheet.title
-        elif sheet_name not in wb.sheetnames:
-            wb.create_sheet(sheet_name)
-
-        ws = wb[sheet_name]
-
-        # Validate start cell
-        try:
-            start_coords = parse_cell_range(start_cell)
-            if not start_coords or not all(
-                coord is not None for coord in start_coords[:2]
-            ):
-                raise DataError(f"Invalid start cell reference: {start_cell}")
-        except ValueError as e:
-            raise DataError(f"Invalid start cell format: {str(e)}")
-
-        if len(data) > 0:
-            _write_data_to_worksheet(ws, data, start_cell)
+        # Large writes that start a new file stream through write-only mode,
+        # skipping per-cell object creation; there is no existing content to
+        # preserve, so the cell-tree path buys nothing. Not taken inside a
+        # defer_saves batch (it saves to disk immediately, which would break
+        # the batch's all-or-nothing abort semantics) or while an earlier
+        # save of the same path is still pending in the background writer:
+        # the file's absence on disk would just mean that save has not
+        # landed yet, and the two writes would race on os.replace.
+        if (
+            sheet_name
+            and start_cell == "A1"
+            and not Path(filepath).exists()
+            and not saves_deferred(filepath)
+            and not pending_writes(filepath)
+            and sum(len(row) for row in data) >= FAST_WRITE_CELL_THRESHOLD
+        ):
+            write_new_workbook(filepath, sheet_name, data)
+            # Drop any stale cached handle for the path so the next borrow
+            # reloads what was just written instead of resurrecting the
+            # pre-write contents.
+            discard_workbook(filepath)
+            return ToolResult(f"Data written to {sheet_name}")
+
+        with open_wb(filepath) as wb:
+            # If no sheet specified, use active sheet
+            if not sheet_name:
+                active_sheet = wb.active
+                if active_sheet is None:
+                    raise DataError("No active sheet found in workbook")
+                sheet_name = active_sheet.title
+            elif sheet_name not in wb.sheetnames:
+                wb.create_sheet(sheet_name)
+
+            ws = wb[sheet_name]
+
+            # Validate start cell
+            try:
+                start_coords = parse_cell_range(start_cell)
+                if not start_coords or not all(
+                    coord is not None for coord in start_coords[:2]
+                ):
+                    raise DataError(f"Invalid start cell reference: {start_cell}")
+            except ValueError as e:
+                raise DataError(f"Invalid start cell format: {str(e)}")
 
-        wb.save(filepath)
-        wb.close()
+            if len(data) > 0:
+                _write_data_to_worksheet(ws, data, start_cell)
 
-        return {"message": f"Data written to {sheet_name}", "active_sheet": sheet_name}
+        return ToolResult(f"Data written to {sheet_name}")
     except DataError as e:
         logger.error(str(e))
         raise
@@ -183,6 +207,7 @@ def read_excel_range_with_metadata(
     start_cell: str = "A1",
     end_cell: Optional[str] = None,
     include_validation: bool = True,
+    columnar: bool = False,
 ) -> Dict[str, Any]:
     """Read data from Excel range with cell metadata including validation rules.
 
@@ -192,95 +217,106 @@ def read_excel_range_with_metadata(
         start_cell: Starting cell address
         end_cell: Ending cell address (optional)
         include_validation: Whether to include validation metadata
+        columnar: Return a struct-of-arrays payload (parallel "addresses",
+            "values", "rows", "columns" lists plus deduplicated
+            "validation_rules" indexed by "validation_idx") instead of one
+            dict per cell; much cheaper to build and serialize on wide reads
 
     Returns:
         Dictionary containing structured cell data with metadata
     """
     try:
-        wb = load_workbook(filepath, read_only=False)
+        with open_wb(filepath, mode="r") as wb:
 
-        if sheet_name not in wb.sheetnames:
-            raise DataError(f"Sheet '{sheet_name}' not found")
+            if sheet_name not in wb.sheetnames:
+                raise DataError(f"Sheet '{sheet_name}' not found")
 
-        ws = wb[sheet_name]
+            ws = wb[sheet_name]
 
-        # Parse start cell
-        if ":" in start_cell:
-            start_cell, end_cell = start_cell.split(":")
-
-        # Get start coordinates
-        try:
-            start_coords = parse_cell_range(f"{start_cell}:{start_cell}")
-            if not start_coords or not all(
-                coord is not None for coord in start_coords[:2]
-            ):
-                raise DataError(f"Invalid start cell reference: {start_cell}")
-            start_row, start_col = start_coords[0], start_coords[1]
-        except ValueError as e:
-            raise DataError(f"Invalid start cell format: {str(e)}")
+            # Parse start cell
+            if ":" in start_cell:
+                start_cell, end_cell = start_cell.split(":")
 
-        # Determine end coordinates
-        if end_cell:
+            # Get start coordinates
             try:
-                end_coords = parse_cell_range(f"{end_cell}:{end_cell}")
-                if not end_coords or not all(
-                    coord is not None for coord in end_coords[:2]
+                start_coords = parse_cell_range(f"{start_cell}:{start_cell}")
+                if not start_coords or not all(
+                    coord is not None for coord in start_coords[:2]
                 ):
-                    raise DataError(f"Invalid end cell reference: {end_cell}")
-                end_row, end_col = end_coords[0], end_coords[1]
+                    raise DataError(f"Invalid start cell reference: {start_cell}")
+                start_row, start_col = start_coords[0], start_coords[1]
             except ValueError as e:
-                raise DataError(f"Invalid end cell format: {str(e)}")
-        else:
-            # If no end_cell, use the full data range of the sheet
-            if ws.max_row == 1 and ws.max_column == 1 and ws.cell(1, 1).value is None:
-                # Handle empty sheet
-                end_row, end_col = start_row, start_col
+                raise DataError(f"Invalid start cell format: {str(e)}")
+
+            # Determine end coordinates
+            if end_cell:
+                try:
+                    end_coords = parse_cell_range(f"{end_cell}:{end_cell}")
+                    if not end_coords or not all(
+                        coord is not None for coord in end_coords[:2]
+                    ):
+                        raise DataError(f"Invalid end cell reference: {end_cell}")
+                    end_row, end_col = end_coords[0], end_coords[1]
+                except ValueError as e:
+                    raise DataError(f"Invalid end cell format: {str(e)}")
             else:
-                # Use the sheet's own boundaries, but respect the provided start_cell
-                end_row, end_col = ws.max_row, ws.max_column
-                # If start_cell is 'A1' (default), we should find the true start
-                if start_cell == "A1":
-                    start_row, start_col = ws.min_row, ws.min_column
-
-        # Validate range bounds
-        if start_row > ws.max_row or start_col > ws.max_column:
-            # This case can happen if start_cell is outside the used area on a sheet with data
-            # or on a completely empty sheet.
-            logger.warning(
-                f"Start cell {start_cell} is outside the sheet's data boundary "
-                f"({get_column_letter(ws.min_column)}{ws.min_row}:{get_column_letter(ws.max_column)}{ws.max_row}). "
-                f"No data will be read."
-            )
-            return {"range": f"{start_cell}:", "sheet_name": sheet_name, "cells": []}
-
-        # Build structured cell data
-        range_str = f"{get_column_letter(start_col)}{start_row}:{get_column_letter(end_col)}{end_row}"
-        range_data = {"range": range_str, "sheet_name": sheet_name, "cells": []}
-
-        for row in range(start_row, end_row + 1):
-            for col in range(start_col, end_col + 1):
-                cell = ws.cell(row=row, column=col)
-                cell_address = f"{get_column_letter(col)}{row}"
-
-                cell_data = {
-                    "address": cell_address,
-                    "value": cell.value,
-                    "row": row,
-                    "column": col,
-                }
-
-                # Add validation metadata if requested
-                if include_validation:
-                    validation_info = get_data_validation_for_cell(ws, cell_address)
-                    if validation_info:
-                        cell_data["validation"] = validation_info
-                    else:
-                        cell_data["validation"] = {"has_validation": False}
-
-                range_data["cells"].append(cell_data)
-
-        wb.close()
-        return range_data
+                # If no end_cell, use the full data range of the sheet
+                if ws.max_row == 1 and ws.max_column == 1 and ws.cell(1, 1).value is None:
+                    # Handle empty sheet
+                    end_row, end_col = start_row, start_col
+                else:
+                    # Use the sheet's own boundaries, but respect the provided start_cell
+                    end_row, end_col = ws.max_row, ws.max_column
+                    # If start_cell is 'A1' (default), we should find the true start
+                    if start_cell == "A1":
+                        start_row, start_col = ws.min_row, ws.min_column
+
+            # Validate range bounds
+            if start_row > ws.max_row or start_col > ws.max_column:
+                # This case can happen if start_cell is outside the used area on a sheet with data
+                # or on a completely empty sheet.
+                logger.warning(
+                    f"Start cell {start_cell} is outside the sheet's data boundary "
+                    f"({get_column_letter(ws.min_column)}{ws.min_row}:{get_column_letter(ws.max_column)}{ws.max_row}). "
+                    f"No data will be read."
+                )
+                return {"range": f"{start_cell}:", "sheet_name": sheet_name, "cells": []}
+
+            # Build structured cell data
+            range_str = f"{get_column_letter(start_col)}{start_row}:{get_column_letter(end_col)}{end_row}"
+
+            if columnar:
+                return _build_columnar_range(
+                    ws, sheet_name, range_str,
+                    start_row, start_col, end_row, end_col,
+                    include_validation,
+                )
+
+            range_data = {"range": range_str, "sheet_name": sheet_name, "cells": []}
+
+            for row in range(start_row, end_row + 1):
+                for col in range(start_col, end_col + 1):
+                    cell = ws.cell(row=row, column=col)
+                    cell_address = f"{get_column_letter(col)}{row}"
+
+                    cell_data = {
+                        "address": cell_address,
+                        "value": cell.value,
+                        "row": row,
+                        "column": col,
+                    }
+
+                    # Add validation metadata if requested
+                    if include_validation:
+                        validation_info = get_data_validation_for_cell(ws, cell_address)
+                        if validation_info:
+                            cell_data["validation"] = validation_info
+                        else:
+                            cell_data["validation"] = {"has_validation": False}
+
+                    range_data["cells"].append(cell_data)
+
+            return range_data
 
     except DataError as e:
         logger.error(str(e))
@@ -288,3 +324,62 @@ def read_excel_range_with_metadata(
     except Exception as e:
         logger.error(f"Failed to read Excel range with metadata: {e}")
         raise DataError(str(e))
+
+
+def _build_columnar_range(
+    ws: Worksheet,
+    sheet_name: str,
+    range_str: str,
+    start_row: int,
+    start_col: int,
+    end_row: int,
+    end_col: int,
+    include_validation: bool,
+) -> Dict[str, Any]:
+    """Build a struct-of-arrays payload for a cell range.
+
+    One parallel list per field instead of a dict per cell, with each
+    distinct validation rule stored once in "validation_rules" and
+    referenced per cell through "validation_idx" (-1 for no validation).
+    """
+    addresses: List[str] = []
+    values: List[Any] = []
+    rows: List[int] = []
+    columns: List[int] = []
+    validation_rules: List[Dict[str, Any]] = []
+    validation_idx: List[int] = []
+    rule_index: Dict[str, int] = {}
+
+    for row in range(start_row, end_row + 1):
+        for col in range(start_col, end_col + 1):
+            cell_address = f"{get_column_letter(col)}{row}"
+            addresses.append(cell_address)
+            values.append(ws.cell(row=row, column=col).value)
+            rows.append(row)
+            columns.append(col)
+
+            if include_validation:
+                validation_info = get_data_validation_for_cell(ws, cell_address)
+                if not validation_info:
+                    validation_idx.append(-1)
+                    continue
+                key = repr(validation_info)
+                index = rule_index.get(key)
+                if index is None:
+                    index = len(validation_rules)
+                    rule_index[key] = index
+                    validation_rules.append(validation_info)
+                validation_idx.append(index)
+
+    range_data: Dict[str, Any] = {
+        "range": range_str,
+        "sheet_name": sheet_name,
+        "addresses": addresses,
+        "values": values,
+        "rows": rows,
+        "columns": columns,
+    }
+    if include_validation:
+        range_data["validation_rules"] = validation_rules
+        range_data["validation_idx"] = validation_idx
+    return range_data
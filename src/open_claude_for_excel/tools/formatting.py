@@ -1,4 +1,5 @@
 import logging
+from functools import lru_cache
 from typing import Any, Dict, Optional
 
 from openpyxl.formatting.rule import (
@@ -20,11 +21,36 @@ from openpyxl.styles import (
 
 from .cell_utils import parse_cell_range, validate_cell_reference
 from .exceptions import FormattingError, ValidationError
-from .workbook import get_or_create_workbook
+from .workbook_cache import open_wb
 
 logger = logging.getLogger(__name__)
 
 
+# Style objects are immutable once assigned, so identical ones can be
+# shared across cells, calls and workbooks. The common agent requests
+# ("make the headers bold", "center this column") only vary a few flag
+# arguments, so memoizing the constructors turns the per-call Font and
+# Alignment allocations into dict hits. Colors are left out: Color
+# instances are unhashable and color-bearing calls are the rare case.
+@lru_cache(maxsize=128)
+def _cached_font(
+    bold: bool, italic: bool, underline: Optional[str], size: Optional[int]
+) -> Font:
+    font_args: Dict[str, Any] = {
+        "bold": bold,
+        "italic": italic,
+        "underline": underline,
+    }
+    if size is not None:
+        font_args["size"] = size
+    return Font(**font_args)
+
+
+@lru_cache(maxsize=32)
+def _cached_alignment(horizontal: Optional[str], wrap_text: bool) -> Alignment:
+    return Alignment(horizontal=horizontal, vertical="center", wrap_text=wrap_text)
+
+
 def format_range(
     filepath: str,
     sheet_name: str,
@@ -88,172 +114,173 @@ def format_range(
         if end_cell and not validate_cell_reference(end_cell):
             raise ValidationError(f"Invalid end cell reference: {end_cell}")
 
-        wb = get_or_create_workbook(filepath)
-        if sheet_name not in wb.sheetnames:
-            raise ValidationError(f"Sheet '{sheet_name}' not found")
+        with open_wb(filepath, create=True) as wb:
+            if sheet_name not in wb.sheetnames:
+                raise ValidationError(f"Sheet '{sheet_name}' not found")
 
-        sheet = wb[sheet_name]
+            sheet = wb[sheet_name]
 
-        # Get cell range coordinates
-        try:
-            start_row, start_col, end_row, end_col = parse_cell_range(
-                start_cell, end_cell
-            )
-        except ValueError as e:
-            raise ValidationError(f"Invalid cell range: {str(e)}")
-
-        # If no end cell specified, use start cell coordinates
-        if end_row is None:
-            end_row = start_row
-        if end_col is None:
-            end_col = start_col
-
-        # Apply font formatting
-        font_args = {
-            "bold": bold,
-            "italic": italic,
-            "underline": "single" if underline else None,
-        }
-        if font_size is not None:
-            font_args["size"] = font_size
-        if font_color is not None:
+            # Get cell range coordinates
             try:
-                # Ensure color has FF prefix for full opacity
-                font_color = (
-                    font_color if font_color.startswith("FF") else f"FF{font_color}"
+                start_row, start_col, end_row, end_col = parse_cell_range(
+                    start_cell, end_cell
                 )
-                font_args["color"] = Color(rgb=font_color)
             except ValueError as e:
-                raise FormattingError(f"Invalid font color: {str(e)}")
-        font = Font(**font_args)
+                raise ValidationError(f"Invalid cell range: {str(e)}")
 
-        # Apply fill
-        fill = None
-        if bg_color is not None:
-            try:
-                # Ensure color has FF prefix for full opacity
-                bg_color = bg_color if bg_color.startswith("FF") else f"FF{bg_color}"
-                fill = PatternFill(
-                    start_color=Color(rgb=bg_color),
-                    end_color=Color(rgb=bg_color),
-                    fill_type="solid",
-                )
-            except ValueError as e:
-                raise FormattingError(f"Invalid background color: {str(e)}")
+            # If no end cell specified, use start cell coordinates
+            if end_row is None:
+                end_row = start_row
+            if end_col is None:
+                end_col = start_col
 
-        # Apply borders
-        border = None
-        if border_style is not None:
-            try:
-                border_color = border_color if border_color else "000000"
-                border_color = (
-                    border_color
-                    if border_color.startswith("FF")
-                    else f"FF{border_color}"
+            # Apply font formatting; the colorless case reuses a shared
+            # memoized Font instead of allocating one per call
+            if font_color is None:
+                font = _cached_font(
+                    bold, italic, "single" if underline else None, font_size
                 )
-                side = Side(style=border_style, color=Color(rgb=border_color))
-                border = Border(left=side, right=side, top=side, bottom=side)
-            except ValueError as e:
-                raise FormattingError(f"Invalid border settings: {str(e)}")
+            else:
+                font_args = {
+                    "bold": bold,
+                    "italic": italic,
+                    "underline": "single" if underline else None,
+                }
+                if font_size is not None:
+                    font_args["size"] = font_size
+                try:
+                    # Ensure color has FF prefix for full opacity
+                    font_color = (
+                        font_color if font_color.startswith("FF") else f"FF{font_color}"
+                    )
+                    font_args["color"] = Color(rgb=font_color)
+                except ValueError as e:
+                    raise FormattingError(f"Invalid font color: {str(e)}")
+                font = Font(**font_args)
 
-        # Apply alignment
-        align = None
-        if alignment is not None or wrap_text:
-            try:
-                align = Alignment(
-                    horizontal=alignment, vertical="center", wrap_text=wrap_text
-                )
-            except ValueError as e:
-                raise FormattingError(f"Invalid alignment settings: {str(e)}")
+            # Apply fill
+            fill = None
+            if bg_color is not None:
+                try:
+                    # Ensure color has FF prefix for full opacity
+                    bg_color = bg_color if bg_color.startswith("FF") else f"FF{bg_color}"
+                    fill = PatternFill(
+                        start_color=Color(rgb=bg_color),
+                        end_color=Color(rgb=bg_color),
+                        fill_type="solid",
+                    )
+                except ValueError as e:
+                    raise FormattingError(f"Invalid background color: {str(e)}")
 
-        # Apply protection
-        protect = None
-        if protection is not None:
-            try:
-                protect = Protection(**protection)
-            except ValueError as e:
-                raise FormattingError(f"Invalid protection settings: {str(e)}")
+            # Apply borders
+            border = None
+            if border_style is not None:
+                try:
+                    border_color = border_color if border_color else "000000"
+                    border_color = (
+                        border_color
+                        if border_color.startswith("FF")
+                        else f"FF{border_color}"
+                    )
+                    side = Side(style=border_style, color=Color(rgb=border_color))
+                    border = Border(left=side, right=side, top=side, bottom=side)
+                except ValueError as e:
+                    raise FormattingError(f"Invalid border settings: {str(e)}")
 
-        # Apply formatting to range
-        for row in range(start_row, end_row + 1):
-            for col in range(start_col, end_col + 1):
-                cell = sheet.cell(row=row, column=col)
-                cell.font = font
-                if fill is not None:
-                    cell.fill = fill
-                if border is not None:
-                    cell.border = border
-                if align is not None:
-                    cell.alignment = align
-                if protect is not None:
-                    cell.protection = protect
-                if number_format is not None:
-                    cell.number_format = number_format
+            # Apply alignment (shared memoized instance)
+            align = None
+            if alignment is not None or wrap_text:
+                try:
+                    align = _cached_alignment(alignment, wrap_text)
+                except ValueError as e:
+                    raise FormattingError(f"Invalid alignment settings: {str(e)}")
 
-        # Merge cells if requested
-        if merge_cells and end_cell:
-            try:
-                range_str = f"{start_cell}:{end_cell}"
-                sheet.merge_cells(range_str)
-            except ValueError as e:
-                raise FormattingError(f"Failed to merge cells: {str(e)}")
+            # Apply protection
+            protect = None
+            if protection is not None:
+                try:
+                    protect = Protection(**protection)
+                except ValueError as e:
+                    raise FormattingError(f"Invalid protection settings: {str(e)}")
 
-        # Apply conditional formatting
-        if conditional_format is not None:
-            range_str = f"{start_cell}:{end_cell}" if end_cell else start_cell
-            rule_type = conditional_format.get("type")
-            if not rule_type:
-                raise FormattingError("Conditional format type not specified")
+            # Apply formatting to range
+            for row in range(start_row, end_row + 1):
+                for col in range(start_col, end_col + 1):
+                    cell = sheet.cell(row=row, column=col)
+                    cell.font = font
+                    if fill is not None:
+                        cell.fill = fill
+                    if border is not None:
+                        cell.border = border
+                    if align is not None:
+                        cell.alignment = align
+                    if protect is not None:
+                        cell.protection = protect
+                    if number_format is not None:
+                        cell.number_format = number_format
 
-            params = conditional_format.get("params", {})
+            # Merge cells if requested
+            if merge_cells and end_cell:
+                try:
+                    range_str = f"{start_cell}:{end_cell}"
+                    sheet.merge_cells(range_str)
+                except ValueError as e:
+                    raise FormattingError(f"Failed to merge cells: {str(e)}")
 
-            # Handle fill parameter for cell_is rule
-            if rule_type == "cell_is" and "fill" in params:
-                fill_params = params["fill"]
-                if isinstance(fill_params, dict):
-                    try:
-                        fill_color = fill_params.get(
-                            "fgColor", "FFC7CE"
-                        )  # Default to light red
-                        fill_color = (
-                            fill_color
-                            if fill_color.startswith("FF")
-                            else f"FF{fill_color}"
-                        )
-                        params["fill"] = PatternFill(
-                            start_color=fill_color,
-                            end_color=fill_color,
-                            fill_type="solid",
-                        )
-                    except ValueError as e:
+            # Apply conditional formatting
+            if conditional_format is not None:
+                range_str = f"{start_cell}:{end_cell}" if end_cell else start_cell
+                rule_type = conditional_format.get("type")
+                if not rule_type:
+                    raise FormattingError("Conditional format type not specified")
+
+                params = conditional_format.get("params", {})
+
+                # Handle fill parameter for cell_is rule
+                if rule_type == "cell_is" and "fill" in params:
+                    fill_params = params["fill"]
+                    if isinstance(fill_params, dict):
+                        try:
+                            fill_color = fill_params.get(
+                                "fgColor", "FFC7CE"
+                            )  # Default to light red
+                            fill_color = (
+                                fill_color
+                                if fill_color.startswith("FF")
+                                else f"FF{fill_color}"
+                            )
+                            params["fill"] = PatternFill(
+                                start_color=fill_color,
+                                end_color=fill_color,
+                                fill_type="solid",
+                            )
+                        except ValueError as e:
+                            raise FormattingError(
+                                f"Invalid conditional format fill color: {str(e)}"
+                            )
+
+                try:
+                    if rule_type == "color_scale":
+                        rule = ColorScaleRule(**params)
+                    elif rule_type == "data_bar":
+                        rule = DataBarRule(**params)
+                    elif rule_type == "icon_set":
+                        rule = IconSetRule(**params)
+                    elif rule_type == "formula":
+                        rule = FormulaRule(**params)
+                    elif rule_type == "cell_is":
+                        rule = CellIsRule(**params)
+                    else:
                         raise FormattingError(
-                            f"Invalid conditional format fill color: {str(e)}"
+                            f"Invalid conditional format type: {rule_type}"
                         )
 
-            try:
-                if rule_type == "color_scale":
-                    rule = ColorScaleRule(**params)
-                elif rule_type == "data_bar":
-                    rule = DataBarRule(**params)
-                elif rule_type == "icon_set":
-                    rule = IconSetRule(**params)
-                elif rule_type == "formula":
-                    rule = FormulaRule(**params)
-                elif rule_type == "cell_is":
-                    rule = CellIsRule(**params)
-                else:
+                    sheet.conditional_formatting.add(range_str, rule)
+                except Exception as e:
                     raise FormattingError(
-                        f"Invalid conditional format type: {rule_type}"
+                        f"Failed to apply conditional formatting: {str(e)}"
                     )
 
-                sheet.conditional_formatting.add(range_str, rule)
-            except Exception as e:
-                raise FormattingError(
-                    f"Failed to apply conditional formatting: {str(e)}"
-                )
-
-        wb.save(filepath)
-
         range_str = f"{start_cell}:{end_cell}" if end_cell else start_cell
         return {
             "message": f"Applied formatting to range {range_str}",
@@ -1,34 +1,34 @@
 import logging
 from copy import copy
-from typing import Any, Dict, Optional
+from typing import Optional
 
-from openpyxl import load_workbook
 from openpyxl.styles import Border, Font, PatternFill, Side
 from openpyxl.utils import column_index_from_string, get_column_letter
 from openpyxl.worksheet.worksheet import Worksheet
 
+from ._result import ToolResult
 from .cell_utils import parse_cell_range
 from .exceptions import SheetError, ValidationError
+from .workbook_cache import open_wb
 
 logger = logging.getLogger(__name__)
 
 
-def copy_sheet(filepath: str, source_sheet: str, target_sheet: str) -> Dict[str, Any]:
+def copy_sheet(filepath: str, source_sheet: str, target_sheet: str) -> ToolResult:
     """Copy a worksheet within the same workbook."""
     try:
-        wb = load_workbook(filepath)
-        if source_sheet not in wb.sheetnames:
-            raise SheetError(f"Source sheet '{source_sheet}' not found")
+        with open_wb(filepath) as wb:
+            if source_sheet not in wb.sheetnames:
+                raise SheetError(f"Source sheet '{source_sheet}' not found")
 
-        if target_sheet in wb.sheetnames:
-            raise SheetError(f"Target sheet '{target_sheet}' already exists")
+            if target_sheet in wb.sheetnames:
+                raise SheetError(f"Target sheet '{target_sheet}' already exists")
 
-        source = wb[source_sheet]
-        target = wb.copy_worksheet(source)
-        target.title = target_sheet
+            source = wb[source_sheet]
+            target = wb.copy_worksheet(source)
+            target.title = target_sheet
 
-        wb.save(filepath)
-        return {"message": f"Sheet '{source_sheet}' copied to '{target_sheet}'"}
+        return ToolResult(f"Sheet '{source_sheet}' copied to '{target_sheet}'")
     except SheetError as e:
         logger.error(str(e))
         raise
@@ -37,19 +37,18 @@ def copy_sheet(filepath: str, source_sheet: str, target_sheet: str) -> Dict[str,
         raise SheetError(str(e))
 
 
-def delete_sheet(filepath: str, sheet_name: str) -> Dict[str, Any]:
+def delete_sheet(filepath: str, sheet_name: str) -> ToolResult:
     """Delete a worksheet from the workbook."""
     try:
-        wb = load_workbook(filepath)
-        if sheet_name not in wb.sheetnames:
-            raise SheetError(f"Sheet '{sheet_name}' not found")
+        with open_wb(filepath) as wb:
+            if sheet_name not in wb.sheetnames:
+                raise SheetError(f"Sheet '{sheet_name}' not found")
 
-        if len(wb.sheetnames) == 1:
-            raise SheetError("Cannot delete the only sheet in workbook")
+            if len(wb.sheetnames) == 1:
+                raise SheetError("Cannot delete the only sheet in workbook")
 
-        del wb[sheet_name]
-        wb.save(filepath)
-        return {"message": f"Sheet '{sheet_name}' deleted"}
+            del wb[sheet_name]
+        return ToolResult(f"Sheet '{sheet_name}' deleted")
     except SheetError as e:
         logger.error(str(e))
         raise
@@ -58,20 +57,19 @@ def delete_sheet(filepath: str, sheet_name: str) -> Dict[str, Any]:
         raise SheetError(str(e))
 
 
-def rename_sheet(filepath: str, old_name: str, new_name: str) -> Dict[str, Any]:
+def rename_sheet(filepath: str, old_name: str, new_name: str) -> ToolResult:
     """Rename a worksheet."""
     try:
-        wb = load_workbook(filepath)
-        if old_name not in wb.sheetnames:
-            raise SheetError(f"Sheet '{old_name}' not found")
+        with open_wb(filepath) as wb:
+            if old_name not in wb.sheetnames:
+                raise SheetError(f"Sheet '{old_name}' not found")
 
-        if new_name in wb.sheetnames:
-            raise SheetError(f"Sheet '{new_name}' already exists")
+            if new_name in wb.sheetnames:
+                raise SheetError(f"Sheet '{new_name}' already exists")
 
-        sheet = wb[old_name]
-        sheet.title = new_name
-        wb.save(filepath)
-        return {"message": f"Sheet renamed from '{old_name}' to '{new_name}'"}
+            sheet = wb[old_name]
+            sheet.title = new_name
+        return ToolResult(f"Sheet renamed from '{old_name}' to '{new_name}'")
     except SheetError as e:
         logger.error(str(e))
         raise
@@ -210,23 +208,26 @@ def delete_range(
 
 def merge_range(
     filepath: str, sheet_name: str, start_cell: str, end_cell: str
-) -> Dict[str, Any]:
+) -> ToolResult:
     """Merge a range of cells."""
     try:
-        wb = load_workbook(filepath)
-        if sheet_name not in wb.sheetnames:
-            raise SheetError(f"Sheet '{sheet_name}' not found")
+        with open_wb(filepath) as wb:
+            if sheet_name not in wb.sheetnames:
+                raise SheetError(f"Sheet '{sheet_name}' not found")
 
-        start_row, start_col, end_row, end_col = parse_cell_range(start_cell, end_cell)
+            start_row, start_col, end_row, end_col = parse_cell_range(
+                start_cell, end_cell
+            )
 
-        if end_row is None or end_col is None:
-            raise SheetError("Both start and end cells must be specified for merging")
+            if end_row is None or end_col is None:
+                raise SheetError(
+                    "Both start and end cells must be specified for merging"
+                )
 
-        range_string = format_range_string(start_row, start_col, end_row, end_col)
-        worksheet = wb[sheet_name]
-        worksheet.merge_cells(range_string)
-        wb.save(filepath)
-        return {"message": f"Range '{range_string}' merged in sheet '{sheet_name}'"}
+            range_string = format_range_string(start_row, start_col, end_row, end_col)
+            worksheet = wb[sheet_name]
+            worksheet.merge_cells(range_string)
+        return ToolResult(f"Range '{range_string}' merged in sheet '{sheet_name}'")
     except SheetError as e:
         logger.error(str(e))
         raise
@@ -237,34 +238,38 @@ def merge_range(
 
 def unmerge_range(
     filepath: str, sheet_name: str, start_cell: str, end_cell: str
-) -> Dict[str, Any]:
+) -> ToolResult:
     """Unmerge a range of cells."""
     try:
-        wb = load_workbook(filepath)
-        if sheet_name not in wb.sheetnames:
-            raise SheetError(f"Sheet '{sheet_name}' not found")
+        with open_wb(filepath) as wb:
+            if sheet_name not in wb.sheetnames:
+                raise SheetError(f"Sheet '{sheet_name}' not found")
 
-        worksheet = wb[sheet_name]
+            worksheet = wb[sheet_name]
 
-        start_row, start_col, end_row, end_col = parse_cell_range(start_cell, end_cell)
+            start_row, start_col, end_row, end_col = parse_cell_range(
+                start_cell, end_cell
+            )
 
-        if end_row is None or end_col is None:
-            raise SheetError("Both start and end cells must be specified for unmerging")
+            if end_row is None or end_col is None:
+                raise SheetError(
+                    "Both start and end cells must be specified for unmerging"
+                )
 
-        range_string = format_range_string(start_row, start_col, end_row, end_col)
+            range_string = format_range_string(start_row, start_col, end_row, end_col)
 
-        # Check if range is actually merged
-        merged_ranges = worksheet.merged_cells.ranges
-        target_range = range_string.upper()
+            # Check if range is actually merged
+            merged_ranges = worksheet.merged_cells.ranges
+            target_range = range_string.upper()
 
-        if not any(
-            str(merged_range).upper() == target_range for merged_range in merged_ranges
-        ):
-            raise SheetError(f"Range '{range_string}' is not merged")
+            if not any(
+                str(merged_range).upper() == target_range
+                for merged_range in merged_ranges
+            ):
+                raise SheetError(f"Range '{range_string}' is not merged")
 
-        worksheet.unmerge_cells(range_string)
-        wb.save(filepath)
-        return {"message": f"Range '{range_string}' unmerged successfully"}
+            worksheet.unmerge_cells(range_string)
+        return ToolResult(f"Range '{range_string}' unmerged successfully")
     except SheetError as e:
         logger.error(str(e))
         raise
@@ -276,11 +281,11 @@ def unmerge_range(
 def get_merged_ranges(filepath: str, sheet_name: str) -> list[str]:
     """Get merged cells in a worksheet."""
     try:
-        wb = load_workbook(filepath)
-        if sheet_name not in wb.sheetnames:
-            raise SheetError(f"Sheet '{sheet_name}' not found")
-        worksheet = wb[sheet_name]
-        return [str(merged_range) for merged_range in worksheet.merged_cells.ranges]
+        with open_wb(filepath, mode="r") as wb:
+            if sheet_name not in wb.sheetnames:
+                raise SheetError(f"Sheet '{sheet_name}' not found")
+            worksheet = wb[sheet_name]
+            return [str(merged_range) for merged_range in worksheet.merged_cells.ranges]
     except SheetError as e:
         logger.error(str(e))
         raise
@@ -296,50 +301,51 @@ def copy_range_operation(
     source_end: str,
     target_start: str,
     target_sheet: Optional[str] = None,
-) -> Dict:
+) -> ToolResult:
     """Copy a range of cells to another location."""
     try:
-        wb = load_workbook(filepath)
-        if sheet_name not in wb.sheetnames:
-            logger.error(f"Sheet '{sheet_name}' not found")
-            raise ValidationError(f"Sheet '{sheet_name}' not found")
+        with open_wb(filepath) as wb:
+            if sheet_name not in wb.sheetnames:
+                logger.error(f"Sheet '{sheet_name}' not found")
+                raise ValidationError(f"Sheet '{sheet_name}' not found")
 
-        source_ws = wb[sheet_name]
-        target_ws = wb[target_sheet] if target_sheet else source_ws
+            source_ws = wb[sheet_name]
+            target_ws = wb[target_sheet] if target_sheet else source_ws
 
-        # Parse source range
-        try:
-            start_row, start_col, end_row, end_col = parse_cell_range(
-                source_start, source_end
-            )
-        except ValueError as e:
-            logger.error(f"Invalid source range: {e}")
-            raise ValidationError(f"Invalid source range: {str(e)}")
-
-        # Parse target starting point
-        try:
-            target_row = int("".join(filter(str.isdigit, target_start)))
-            target_col = column_index_from_string(
-                "".join(filter(str.isalpha, target_start))
-            )
-        except ValueError as e:
-            logger.error(f"Invalid target cell: {e}")
-            raise ValidationError(f"Invalid target cell: {str(e)}")
-
-        # Copy the range
-        row_offset = target_row - start_row
-        col_offset = target_col - start_col
-
-        for i in range(start_row, end_row + 1):
-            for j in range(start_col, end_col + 1):
-                source_cell = source_ws.cell(row=i, column=j)
-                target_cell = target_ws.cell(row=i + row_offset, column=j + col_offset)
-                target_cell.value = source_cell.value
-                if source_cell.has_style:
-                    target_cell._style = copy(source_cell._style)
+            # Parse source range
+            try:
+                start_row, start_col, end_row, end_col = parse_cell_range(
+                    source_start, source_end
+                )
+            except ValueError as e:
+                logger.error(f"Invalid source range: {e}")
+                raise ValidationError(f"Invalid source range: {str(e)}")
 
-        wb.save(filepath)
-        return {"message": "Range copied successfully"}
+            # Parse target starting point
+            try:
+                target_row = int("".join(filter(str.isdigit, target_start)))
+                target_col = column_index_from_string(
+                    "".join(filter(str.isalpha, target_start))
+                )
+            except ValueError as e:
+                logger.error(f"Invalid target cell: {e}")
+                raise ValidationError(f"Invalid target cell: {str(e)}")
+
+            # Copy the range
+            row_offset = target_row - start_row
+            col_offset = target_col - start_col
+
+            for i in range(start_row, end_row + 1):
+                for j in range(start_col, end_col + 1):
+                    source_cell = source_ws.cell(row=i, column=j)
+                    target_cell = target_ws.cell(
+                        row=i + row_offset, column=j + col_offset
+                    )
+                    target_cell.value = source_cell.value
+                    if source_cell.has_style:
+                        target_cell._style = copy(source_cell._style)
+
+        return ToolResult("Range copied successfully")
 
     except (ValidationError, SheetError):
         raise
@@ -354,53 +360,55 @@ def delete_range_operation(
     start_cell: str,
     end_cell: Optional[str] = None,
     shift_direction: str = "up",
-) -> Dict[str, Any]:
+) -> ToolResult:
     """Delete a range of cells and shift remaining cells."""
     try:
-        wb = load_workbook(filepath)
-        if sheet_name not in wb.sheetnames:
-            raise SheetError(f"Sheet '{sheet_name}' not found")
+        with open_wb(filepath) as wb:
+            if sheet_name not in wb.sheetnames:
+                raise SheetError(f"Sheet '{sheet_name}' not found")
 
-        worksheet = wb[sheet_name]
+            worksheet = wb[sheet_name]
 
-        # Validate range
-        try:
-            start_row, start_col, end_row, end_col = parse_cell_range(
-                start_cell, end_cell
-            )
-            if end_row and end_row > worksheet.max_row:
-                raise SheetError(
-                    f"End row {end_row} out of bounds (1-{worksheet.max_row})"
+            # Validate range
+            try:
+                start_row, start_col, end_row, end_col = parse_cell_range(
+                    start_cell, end_cell
                 )
-            if end_col and end_col > worksheet.max_column:
-                raise SheetError(
-                    f"End column {end_col} out of bounds (1-{worksheet.max_column})"
+                if end_row and end_row > worksheet.max_row:
+                    raise SheetError(
+                        f"End row {end_row} out of bounds (1-{worksheet.max_row})"
+                    )
+                if end_col and end_col > worksheet.max_column:
+                    raise SheetError(
+                        f"End column {end_col} out of bounds (1-{worksheet.max_column})"
+                    )
+            except ValueError as e:
+                raise SheetError(f"Invalid range: {str(e)}")
+
+            # Validate shift direction
+            if shift_direction not in ["up", "left"]:
+                raise ValidationError(
+                    f"Invalid shift direction: {shift_direction}. Must be 'up' or 'left'"
                 )
-        except ValueError as e:
-            raise SheetError(f"Invalid range: {str(e)}")
 
-        # Validate shift direction
-        if shift_direction not in ["up", "left"]:
-            raise ValidationError(
-                f"Invalid shift direction: {shift_direction}. Must be 'up' or 'left'"
+            range_string = format_range_string(
+                start_row, start_col, end_row or start_row, end_col or start_col
             )
 
-        range_string = format_range_string(
-            start_row, start_col, end_row or start_row, end_col or start_col
-        )
-
-        # Delete range contents
-        delete_range(worksheet, start_cell, end_cell)
+            # Delete range contents
+            delete_range(worksheet, start_cell, end_cell)
 
-        # Shift cells if needed
-        if shift_direction == "up":
-            worksheet.delete_rows(start_row, (end_row or start_row) - start_row + 1)
-        elif shift_direction == "left":
-            worksheet.delete_cols(start_col, (end_col or start_col) - start_col + 1)
-
-        wb.save(filepath)
+            # Shift cells if needed
+            if shift_direction == "up":
+                worksheet.delete_rows(
+                    start_row, (end_row or start_row) - start_row + 1
+                )
+            elif shift_direction == "left":
+                worksheet.delete_cols(
+                    start_col, (end_col or start_col) - start_col + 1
+                )
 
-        return {"message": f"Range {range_string} deleted successfully"}
+        return ToolResult(f"Range {range_string} deleted successfully")
     except (ValidationError, SheetError) as e:
         logger.error(str(e))
         raise
@@ -411,27 +419,26 @@ def delete_range_operation(
 
 def insert_row(
     filepath: str, sheet_name: str, start_row: int, count: int = 1
-) -> Dict[str, Any]:
+) -> ToolResult:
     """Insert one or more rows starting at the specified row."""
     try:
-        wb = load_workbook(filepath)
-        if sheet_name not in wb.sheetnames:
-            raise SheetError(f"Sheet '{sheet_name}' not found")
+        with open_wb(filepath) as wb:
+            if sheet_name not in wb.sheetnames:
+                raise SheetError(f"Sheet '{sheet_name}' not found")
 
-        worksheet = wb[sheet_name]
+            worksheet = wb[sheet_name]
 
-        # Validate parameters
-        if start_row < 1:
-            raise ValidationError("Start row must be 1 or greater")
-        if count < 1:
-            raise ValidationError("Count must be 1 or greater")
+            # Validate parameters
+            if start_row < 1:
+                raise ValidationError("Start row must be 1 or greater")
+            if count < 1:
+                raise ValidationError("Count must be 1 or greater")
 
-        worksheet.insert_rows(start_row, count)
-        wb.save(filepath)
+            worksheet.insert_rows(start_row, count)
 
-        return {
-            "message": f"Inserted {count} row(s) starting at row {start_row} in sheet '{sheet_name}'"
-        }
+        return ToolResult(
+            f"Inserted {count} row(s) starting at row {start_row} in sheet '{sheet_name}'"
+        )
     except (ValidationError, SheetError) as e:
         logger.error(str(e))
         raise
@@ -442,27 +449,26 @@ def insert_row(
 
 def insert_cols(
     filepath: str, sheet_name: str, start_col: int, count: int = 1
-) -> Dict[str, Any]:
+) -> ToolResult:
     """Insert one or more columns starting at the specified column."""
     try:
-        wb = load_workbook(filepath)
-        if sheet_name not in wb.sheetnames:
-            raise SheetError(f"Sheet '{sheet_name}' not found")
+        with open_wb(filepath) as wb:
+            if sheet_name not in wb.sheetnames:
+                raise SheetError(f"Sheet '{sheet_name}' not found")
 
-        worksheet = wb[sheet_name]
+            worksheet = wb[sheet_name]
 
-        # Validate parameters
-        if start_col < 1:
-            raise ValidationError("Start column must be 1 or greater")
-        if count < 1:
-            raise ValidationError("Count must be 1 or greater")
+            # Validate parameters
+            if start_col < 1:
+                raise ValidationError("Start column must be 1 or greater")
+            if count < 1:
+                raise ValidationError("Count must be 1 or greater")
 
-        worksheet.insert_cols(start_col, count)
-        wb.save(filepath)
+            worksheet.insert_cols(start_col, count)
 
-        return {
-            "message": f"Inserted {count} column(s) starting at column {start_col} in sheet '{sheet_name}'"
-        }
+        return ToolResult(
+            f"Inserted {count} column(s) starting at column {start_col} in sheet '{sheet_name}'"
+        )
     except (ValidationError, SheetError) as e:
         logger.error(str(e))
         raise
@@ -473,31 +479,30 @@ def insert_cols(
 
 def delete_rows(
     filepath: str, sheet_name: str, start_row: int, count: int = 1
-) -> Dict[str, Any]:
+) -> ToolResult:
     """Delete one or more rows starting at the specified row."""
     try:
-        wb = load_workbook(filepath)
-        if sheet_name not in wb.sheetnames:
-            raise SheetError(f"Sheet '{sheet_name}' not found")
-
-        worksheet = wb[sheet_name]
-
-        # Validate parameters
-        if start_row < 1:
-            raise ValidationError("Start row must be 1 or greater")
-        if count < 1:
-            raise ValidationError("Count must be 1 or greater")
-        if start_row > worksheet.max_row:
-            raise ValidationError(
-                f"Start row {start_row} exceeds worksheet bounds (max row: {worksheet.max_row})"
-            )
+        with open_wb(filepath) as wb:
+            if sheet_name not in wb.sheetnames:
+                raise SheetError(f"Sheet '{sheet_name}' not found")
+
+            worksheet = wb[sheet_name]
+
+            # Validate parameters
+            if start_row < 1:
+                raise ValidationError("Start row must be 1 or greater")
+            if count < 1:
+                raise ValidationError("Count must be 1 or greater")
+            if start_row > worksheet.max_row:
+                raise ValidationError(
+                    f"Start row {start_row} exceeds worksheet bounds (max row: {worksheet.max_row})"
+                )
 
-        worksheet.delete_rows(start_row, count)
-        wb.save(filepath)
+            worksheet.delete_rows(start_row, count)
 
-        return {
-            "message": f"Deleted {count} row(s) starting at row {start_row} in sheet '{sheet_name}'"
-        }
+        return ToolResult(
+            f"Deleted {count} row(s) starting at row {start_row} in sheet '{sheet_name}'"
+        )
     except (ValidationError, SheetError) as e:
         logger.error(str(e))
         raise
@@ -508,31 +513,30 @@ def delete_rows(
 
 def delete_cols(
     filepath: str, sheet_name: str, start_col: int, count: int = 1
-) -> Dict[str, Any]:
+) -> ToolResult:
     """Delete one or more columns starting at the specified column."""
     try:
-        wb = load_workbook(filepath)
-        if sheet_name not in wb.sheetnames:
-            raise SheetError(f"Sheet '{sheet_name}' not found")
-
-        worksheet = wb[sheet_name]
-
-        # Validate parameters
-        if start_col < 1:
-            raise ValidationError("Start column must be 1 or greater")
-        if count < 1:
-            raise ValidationError("Count must be 1 or greater")
-        if start_col > worksheet.max_column:
-            raise ValidationError(
-                f"Start column {start_col} exceeds worksheet bounds (max column: {worksheet.max_column})"
-            )
+        with open_wb(filepath) as wb:
+            if sheet_name not in wb.sheetnames:
+                raise SheetError(f"Sheet '{sheet_name}' not found")
+
+            worksheet = wb[sheet_name]
+
+            # Validate parameters
+            if start_col < 1:
+                raise ValidationError("Start column must be 1 or greater")
+            if count < 1:
+                raise ValidationError("Count must be 1 or greater")
+            if start_col > worksheet.max_column:
+                raise ValidationError(
+                    f"Start column {start_col} exceeds worksheet bounds (max column: {worksheet.max_column})"
+                )
 
-        worksheet.delete_cols(start_col, count)
-        wb.save(filepath)
+            worksheet.delete_cols(start_col, count)
 
-        return {
-            "message": f"Deleted {count} column(s) starting at column {start_col} in sheet '{sheet_name}'"
-        }
+        return ToolResult(
+            f"Deleted {count} column(s) starting at column {start_col} in sheet '{sheet_name}'"
+        )
     except (ValidationError, SheetError) as e:
         logger.error(str(e))
         raise
@@ -1,9 +1,9 @@
 import uuid
 import logging
 
-from openpyxl import load_workbook
 from openpyxl.worksheet.table import Table, TableStyleInfo
 from .exceptions import DataError
+from .workbook_cache import open_wb
 
 logger = logging.getLogger(__name__)
 
@@ -27,37 +27,35 @@ def create_excel_table(
         A dictionary with a success message and table details.
     """
     try:
-        wb = load_workbook(filepath)
-        if sheet_name not in wb.sheetnames:
-            raise DataError(f"Sheet '{sheet_name}' not found.")
-            
-        ws = wb[sheet_name]
+        with open_wb(filepath) as wb:
+            if sheet_name not in wb.sheetnames:
+                raise DataError(f"Sheet '{sheet_name}' not found.")
 
-        # If no table name is provided, generate a unique one
-        if not table_name:
-            table_name = f"Table_{uuid.uuid4().hex[:8]}"
+            ws = wb[sheet_name]
 
-        # Check if table name already exists
-        if table_name in ws.parent.defined_names:
-            raise DataError(f"Table name '{table_name}' already exists.")
+            # If no table name is provided, generate a unique one
+            if not table_name:
+                table_name = f"Table_{uuid.uuid4().hex[:8]}"
+
+            # Check if table name already exists
+            if table_name in ws.parent.defined_names:
+                raise DataError(f"Table name '{table_name}' already exists.")
+
+            # Create the table
+            table = Table(displayName=table_name, ref=data_range)
+
+            # Apply style
+            style = TableStyleInfo(
+                name=table_style,
+                showFirstColumn=False,
+                showLastColumn=False,
+                showRowStripes=True,
+                showColumnStripes=False
+            )
+            table.tableStyleInfo = style
+
+            ws.add_table(table)
 
-        # Create the table
-        table = Table(displayName=table_name, ref=data_range)
-        
-        # Apply style
-        style = TableStyleInfo(
-            name=table_style, 
-            showFirstColumn=False,
-            showLastColumn=False, 
-            showRowStripes=True, 
-            showColumnStripes=False
-        )
-        table.tableStyleInfo = style
-        
-        ws.add_table(table)
-        
-        wb.save(filepath)
-        
         return {
             "message": f"Successfully created table '{table_name}' in sheet '{sheet_name}'.",
             "table_name": table_name,
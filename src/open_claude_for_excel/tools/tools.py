@@ -1,12 +1,31 @@
+import atexit
+import json
 import logging
+import logging.handlers
 import os
+import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from functools import lru_cache, wraps
+from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 # from mcp.server.fastmcp import FastMCP
 from langchain_core.tools import tool
 
+from open_claude_for_excel.tools._fast_read import HAS_CALAMINE, read_range
+from open_claude_for_excel.tools._parallel_read import read_ranges_parallel
+from open_claude_for_excel.tools._result import ToolResult
+from open_claude_for_excel.tools.calculations import (
+    apply_formula as apply_formula_impl,
+)
+from open_claude_for_excel.tools.calculations import (
+    apply_formula_validated as apply_formula_validated_impl,
+)
+from open_claude_for_excel.tools.cell_validation import get_all_validation_ranges
 from open_claude_for_excel.tools.chart import create_chart_in_sheet as create_chart_impl
-from open_claude_for_excel.tools.data import write_data
+from open_claude_for_excel.tools.data import read_excel_range_with_metadata, write_data
 
 # Import exceptions
 from open_claude_for_excel.tools.exceptions import (
@@ -19,12 +38,17 @@ from open_claude_for_excel.tools.exceptions import (
     ValidationError,
     WorkbookError,
 )
+from open_claude_for_excel.tools.formatting import (
+    format_range as format_range_impl,
+)
 from open_claude_for_excel.tools.pivot import (
     create_pivot_table as create_pivot_table_impl,
 )
 from open_claude_for_excel.tools.sheet import (
+    copy_range_operation,
     copy_sheet,
     delete_cols,
+    delete_range_operation,
     delete_rows,
     delete_sheet,
     get_merged_ranges,
@@ -38,12 +62,25 @@ from open_claude_for_excel.tools.tables import create_excel_table as create_tabl
 
 # Import from open_claude_for_excel.tools package with consistent _impl suffixes
 from open_claude_for_excel.tools.validation import (
-    validate_formula_in_cell_operation as validate_formula_impl,
+    validate_formula_syntax_only as validate_syntax_impl,
 )
 from open_claude_for_excel.tools.validation import (
     validate_range_in_sheet_operation as validate_range_impl,
 )
+from open_claude_for_excel.tools.workbook import (
+    create_sheet as create_worksheet_impl,
+)
+from open_claude_for_excel.tools.workbook import (
+    create_workbook as create_workbook_impl,
+)
 from open_claude_for_excel.tools.workbook import get_workbook_info
+from open_claude_for_excel.tools.workbook_cache import (
+    defer_saves,
+    discard_workbook,
+    flush_workbooks,
+    open_wb,
+    pending_writes,
+)
 
 # Get project root directory path for log file path.
 # When using the stdio transmission method,
@@ -59,16 +96,36 @@ LOG_FILE = os.path.join(ROOT_DIR, "open-claude-for-excel.log")
 OPEN_CLAUDE_FOR_EXCEL_FILES_PATH = None
 
 # Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[
-        # Referring to https://github.com/modelcontextprotocol/python-sdk/issues/409#issuecomment-2816831318
-        # The stdio mode server MUST NOT write anything to its stdout that is not a valid MCP message.
-        logging.FileHandler(LOG_FILE)
-    ],
+# Referring to https://github.com/modelcontextprotocol/python-sdk/issues/409#issuecomment-2816831318
+# The stdio mode server MUST NOT write anything to its stdout that is not a valid MCP message.
+# delay=True defers opening the file until the first record actually reaches
+# it, and the MemoryHandler wrapper batches records so INFO-heavy sessions
+# pay one write per 1024 records instead of one syscall each; errors flush
+# the buffer immediately and an atexit hook flushes whatever remains.
+_file_handler = logging.FileHandler(LOG_FILE, delay=True)
+_file_handler.setFormatter(
+    logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+)
+_buffered_handler = logging.handlers.MemoryHandler(
+    capacity=1024, flushLevel=logging.ERROR, target=_file_handler
 )
+logging.basicConfig(level=logging.INFO, handlers=[_buffered_handler])
+atexit.register(_buffered_handler.flush)
 logger = logging.getLogger("excel-mcp")
+
+# orjson's C encoder is several times faster than stdlib json on the large
+# payloads the read tools return; fall back to stdlib when it is absent.
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2, default=str).decode()
+except ImportError:
+
+    def _dumps(obj: Any) -> str:
+        return json.dumps(obj, indent=2, default=str)
+
+
 # # Initialize FastMCP server
 # mcp = FastMCP(
 #     "excel-mcp",
@@ -78,31 +135,68 @@ logger = logging.getLogger("excel-mcp")
 # )
 
 
-def get_excel_path(filename: str) -> str:
-    """Get full path to Excel file.
+@lru_cache(maxsize=1024)
+def _resolve_excel_path(filename: str, base: Optional[str]) -> Path:
+    """Resolve a tool-provided filename against the SSE base directory.
 
-    Args:
-        filename: Name of Excel file
-
-    Returns:
-        Full path to Excel file
+    Pure in (filename, base), so results are memoized; agent sessions hit
+    the same handful of paths on every tool call and pay the resolve()
+    syscalls once per path. Returns a normalized Path that downstream
+    code passes around as os.PathLike.
     """
-    # If filename is already an absolute path, return it
+    # If filename is already an absolute path, normalize and return it
     if os.path.isabs(filename):
-        return filename
+        return Path(filename).resolve(strict=False)
 
     # Check if in SSE mode (EXCEL_FILES_PATH is not None)
-    if OPEN_CLAUDE_FOR_EXCEL_FILES_PATH is None:
+    if base is None:
         # Must use absolute path
         raise ValueError(
             f"Invalid filename: {filename}, must be an absolute path when not in SSE mode"
         )
 
     # In SSE mode, if it's a relative path, resolve it based on EXCEL_FILES_PATH
-    return os.path.join(OPEN_CLAUDE_FOR_EXCEL_FILES_PATH, filename)
+    return (Path(base) / filename).resolve(strict=False)
+
+
+def get_excel_path(filename: str) -> Path:
+    """Get full path to Excel file.
+
+    Args:
+        filename: Name of Excel file
+
+    Returns:
+        Full path to Excel file
+    """
+    return _resolve_excel_path(filename, OPEN_CLAUDE_FOR_EXCEL_FILES_PATH)
+
+
+def tool_errors(*exc_types):
+    """Funnel expected exceptions of a tool wrapper into "Error: ..." strings.
+
+    Replaces the identical try/except boilerplate each wrapper used to
+    carry: the listed exception types become an "Error: ..." return value
+    for the model to read, anything else is logged and re-raised.
+    """
+
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            try:
+                return func(*args, **kwargs)
+            except exc_types as e:
+                return f"Error: {str(e)}"
+            except Exception as e:
+                logger.error(f"Error in {func.__name__}: {e}")
+                raise
+
+        return wrapper
+
+    return decorator
 
 
 @tool(parse_docstring=True)
+@tool_errors(ValidationError, CalculationError)
 def apply_formula(
     filepath: str,
     sheet_name: str,
@@ -120,28 +214,19 @@ def apply_formula(
     Returns:
         Success message
     """
-    try:
-        full_path = get_excel_path(filepath)
-        # First validate the formula
-        validation = validate_formula_impl(full_path, sheet_name, cell, formula)
-        if isinstance(validation, dict) and "error" in validation:
-            return f"Error: {validation['error']}"
-
-        # If valid, apply the formula
-        from open_claude_for_excel.tools.calculations import (
-            apply_formula as apply_formula_impl,
-        )
-
-        result = apply_formula_impl(full_path, sheet_name, cell, formula)
-        return result["message"]
-    except (ValidationError, CalculationError) as e:
-        return f"Error: {str(e)}"
-    except Exception as e:
-        logger.error(f"Error applying formula: {e}")
-        raise
+    full_path = get_excel_path(filepath)
+    # Validate once, purely syntactically (no workbook load); the write
+    # path then skips re-validation, so the formula is parsed a single
+    # time per call instead of twice.
+    if not formula.startswith("="):
+        formula = f"={formula}"
+    validate_syntax_impl(cell, formula)
+    result = apply_formula_validated_impl(full_path, sheet_name, cell, formula)
+    return result["message"]
 
 
 @tool(parse_docstring=True)
+@tool_errors(ValidationError, CalculationError)
 def validate_formula_syntax(
     filepath: str,
     sheet_name: str,
@@ -159,18 +244,17 @@ def validate_formula_syntax(
     Returns:
         Validation result message
     """
-    try:
-        full_path = get_excel_path(filepath)
-        result = validate_formula_impl(full_path, sheet_name, cell, formula)
-        return result["message"]
-    except (ValidationError, CalculationError) as e:
-        return f"Error: {str(e)}"
-    except Exception as e:
-        logger.error(f"Error validating formula: {e}")
-        raise
+    get_excel_path(filepath)
+    # Syntax checks are pure string work: cell reference format, parenthesis
+    # balance, unsafe functions and embedded references. None of that needs
+    # the workbook, so skip the parse entirely; apply_formula is the path
+    # that compares against live cell content.
+    result = validate_syntax_impl(cell, formula)
+    return result["message"]
 
 
 @tool(parse_docstring=True)
+@tool_errors(ValidationError, FormattingError)
 def format_range(
     filepath: str,
     sheet_name: str,
@@ -216,48 +300,77 @@ def format_range(
     Returns:
         Success message
     """
-    try:
-        full_path = get_excel_path(filepath)
-        from open_claude_for_excel.tools.formatting import (
-            format_range as format_range_func,
-        )
-
-        # Convert None values to appropriate defaults for the underlying function
-        format_range_func(
-            filepath=full_path,
-            sheet_name=sheet_name,
-            start_cell=start_cell,
-            end_cell=end_cell,  # This can be None
-            bold=bold,
-            italic=italic,
-            underline=underline,
-            font_size=font_size,  # This can be None
-            font_color=font_color,  # This can be None
-            bg_color=bg_color,  # This can be None
-            border_style=border_style,  # This can be None
-            border_color=border_color,  # This can be None
-            number_format=number_format,  # This can be None
-            alignment=alignment,  # This can be None
-            wrap_text=wrap_text,
-            merge_cells=merge_cells,
-            protection=protection,  # This can be None
-            conditional_format=conditional_format,  # This can be None
+    full_path = get_excel_path(filepath)
+
+    # Convert None values to appropriate defaults for the underlying function
+    format_range_impl(
+        filepath=full_path,
+        sheet_name=sheet_name,
+        start_cell=start_cell,
+        end_cell=end_cell,  # This can be None
+        bold=bold,
+        italic=italic,
+        underline=underline,
+        font_size=font_size,  # This can be None
+        font_color=font_color,  # This can be None
+        bg_color=bg_color,  # This can be None
+        border_style=border_style,  # This can be None
+        border_color=border_color,  # This can be None
+        number_format=number_format,  # This can be None
+        alignment=alignment,  # This can be None
+        wrap_text=wrap_text,
+        merge_cells=merge_cells,
+        protection=protection,  # This can be None
+        conditional_format=conditional_format,  # This can be None
+    )
+    return "Range formatted successfully"
+
+
+# Agent loops often re-request the same range within seconds as they
+# reason. Two layers keep that from repeating the parse: concurrent
+# identical reads share one in-flight Future, and recently serialized
+# payloads sit in a small LRU keyed by (path, range, flags, mtime). The
+# on-disk mtime in the key makes both layers self-invalidating.
+_READ_CACHE_SIZE = 64
+_read_lock = threading.Lock()
+_inflight: Dict[tuple, Future] = {}
+_read_cache: "OrderedDict[tuple, str]" = OrderedDict()
+
+
+def _read_range_serialized(
+    full_path: str,
+    sheet_name: str,
+    start_cell: str,
+    end_cell: Optional[str],
+    include_validation: bool,
+) -> str:
+    """Read one range and return the serialized tool payload."""
+    if not include_validation and HAS_CALAMINE:
+        # Values-only reads skip openpyxl entirely for the Rust parser.
+        result = read_range(full_path, sheet_name, start_cell, end_cell)
+    else:
+        result = read_excel_range_with_metadata(
+            full_path,
+            sheet_name,
+            start_cell,
+            end_cell,
+            include_validation=include_validation,
+            columnar=True,
         )
-        return "Range formatted successfully"
-    except (ValidationError, FormattingError) as e:
-        return f"Error: {str(e)}"
-    except Exception as e:
-        logger.error(f"Error formatting range: {e}")
-        raise
+    if not result or not (result.get("cells") or result.get("addresses")):
+        return "No data found in specified range"
+    return _dumps(result)
 
 
 @tool(parse_docstring=True)
+@tool_errors()
 def read_data_from_excel(
     filepath: str,
     sheet_name: str,
     start_cell: str = "A1",
     end_cell: Optional[str] = None,
     preview_only: bool = False,
+    include_validation: bool = True,
 ) -> str:
     """Read data from Excel worksheet with cell metadata including validation rules.
 
@@ -267,31 +380,105 @@ def read_data_from_excel(
         start_cell: Starting cell (default A1)
         end_cell: Ending cell (optional, auto-expands if not provided)
         preview_only: Whether to return preview only
+        include_validation: Whether to include per-cell validation metadata; set False for plain values (faster on large ranges)
 
     Returns:
-        JSON string containing structured cell data with validation metadata. Each cell includes: address, value, row, column, and validation info (if any).
+        JSON string with the range in columnar form: parallel "addresses", "values", "rows" and "columns" lists, plus deduplicated "validation_rules" referenced per cell via "validation_idx" (-1 means no validation).
     """
+    full_path = get_excel_path(filepath)
+
     try:
-        full_path = get_excel_path(filepath)
-        from open_claude_for_excel.tools.data import read_excel_range_with_metadata
+        mtime = os.stat(full_path).st_mtime_ns
+    except OSError:
+        mtime = None
+    key = (full_path, sheet_name, start_cell, end_cell, include_validation)
+
+    # Skip both cache layers while the handle cache holds unwritten changes
+    # for this file: the on-disk mtime in the key would be stale.
+    if mtime is None or pending_writes(full_path):
+        return _read_range_serialized(
+            full_path, sheet_name, start_cell, end_cell, include_validation
+        )
 
-        result = read_excel_range_with_metadata(
-            full_path, sheet_name, start_cell, end_cell
+    key = key + (mtime,)
+    with _read_lock:
+        cached = _read_cache.get(key)
+        if cached is not None:
+            _read_cache.move_to_end(key)
+            return cached
+        future = _inflight.get(key)
+        if future is None:
+            future = Future()
+            _inflight[key] = future
+            owner = True
+        else:
+            owner = False
+
+    if not owner:
+        # Another thread is already parsing this exact range; share its
+        # result instead of repeating the work.
+        return future.result()
+
+    try:
+        payload = _read_range_serialized(
+            full_path, sheet_name, start_cell, end_cell, include_validation
         )
-        if not result or not result.get("cells"):
-            return "No data found in specified range"
+    except BaseException as e:
+        with _read_lock:
+            _inflight.pop(key, None)
+        future.set_exception(e)
+        raise
+    with _read_lock:
+        _read_cache[key] = payload
+        if len(_read_cache) > _READ_CACHE_SIZE:
+            _read_cache.popitem(last=False)
+        _inflight.pop(key, None)
+    future.set_result(payload)
+    return payload
 
-        # Return as formatted JSON string
-        import json
 
-        return json.dumps(result, indent=2, default=str)
+@tool(parse_docstring=True)
+@tool_errors(DataError)
+def read_many_ranges(requests: List[Dict[str, Any]]) -> str:
+    """Read several ranges, across one or many workbooks, in parallel.
 
-    except Exception as e:
-        logger.error(f"Error reading data: {e}")
-        raise
+    Requests are grouped per file and fanned out over a process pool, so
+    each workbook is parsed once regardless of how many of its ranges are
+    requested and different workbooks are parsed on different cores. Use
+    this instead of repeated read_data_from_excel calls when gathering
+    data from multiple sheets or files.
+
+    Args:
+        requests: List of dicts, each with "filepath" and "sheet_name" plus optional "start_cell", "end_cell" and "include_validation"
+
+    Returns:
+        JSON string with one result per request, in request order; failed requests carry an "error" field instead of data
+    """
+    grouped: Dict[str, List[tuple]] = {}
+    for index, request in enumerate(requests):
+        full_path = get_excel_path(request["filepath"])
+        grouped.setdefault(full_path, []).append((index, request))
+
+    # Workers read from disk directly, so pending saves must land first.
+    for full_path in grouped:
+        flush_workbooks(full_path)
+
+    per_file = read_ranges_parallel(
+        {
+            full_path: [request for _, request in indexed]
+            for full_path, indexed in grouped.items()
+        }
+    )
+
+    ordered: List[Dict[str, Any]] = [None] * len(requests)
+    for full_path, indexed in grouped.items():
+        for (index, _), result in zip(indexed, per_file[full_path]):
+            ordered[index] = result
+    return _dumps(ordered)
 
 
 @tool(parse_docstring=True)
+@tool_errors(ValidationError, DataError)
 def write_data_to_excel(
     filepath: str,
     sheet_name: str,
@@ -309,18 +496,84 @@ def write_data_to_excel(
     Returns:
         Success message
     """
-    try:
-        full_path = get_excel_path(filepath)
-        result = write_data(full_path, sheet_name, data, start_cell)
-        return result["message"]
-    except (ValidationError, DataError) as e:
-        return f"Error: {str(e)}"
-    except Exception as e:
-        logger.error(f"Error writing data: {e}")
-        raise
+    full_path = get_excel_path(filepath)
+    result = write_data(full_path, sheet_name, data, start_cell)
+    return result.message
 
 
 @tool(parse_docstring=True)
+@tool_errors()
+def batch_operations(filepath: str, operations: List[Dict[str, Any]]) -> str:
+    """Run multiple write operations against one workbook with a single save.
+
+    Each operation is applied in order to the same open workbook and the file
+    is saved once at the end, so N operations cost one open/save instead of N.
+    If an operation fails the batch stops and none of its changes are saved.
+
+    Args:
+        filepath: Path to Excel file
+        operations: List of operations, each a dict with "op" (one of write_data_to_excel, apply_formula, format_range, merge_cells, unmerge_cells) and "args" (the keyword arguments of that tool, without filepath)
+
+    Returns:
+        JSON string with one result entry per attempted operation
+    """
+    handlers = {
+        "write_data_to_excel": write_data,
+        "apply_formula": apply_formula_impl,
+        "format_range": format_range_impl,
+        "merge_cells": merge_range,
+        "unmerge_cells": unmerge_range,
+    }
+
+    full_path = get_excel_path(filepath)
+    results = []
+    with defer_saves(full_path):
+        for operation in operations:
+            op_name = operation.get("op")
+            handler = handlers.get(op_name)
+            if handler is None:
+                # Roll back so "no changes saved" holds for the whole batch.
+                discard_workbook(full_path)
+                results.append(
+                    {
+                        "op": op_name,
+                        "status": "error",
+                        "message": f"Unknown operation '{op_name}'. "
+                        f"Supported: {', '.join(handlers)}; "
+                        "batch aborted, no changes saved",
+                    }
+                )
+                break
+            try:
+                result = handler(full_path, **(operation.get("args") or {}))
+                message = (
+                    result.message
+                    if isinstance(result, ToolResult)
+                    else result["message"]
+                )
+                results.append(
+                    {"op": op_name, "status": "ok", "message": message}
+                )
+            except Exception as e:
+                # A failure inside a mutating block already discarded the
+                # entry; one that raised before borrowing the workbook (e.g.
+                # formula or cell validation) left the earlier operations'
+                # mutations cached, and defer_saves' exit would flush them.
+                # Drop the entry so the abort message stays truthful.
+                discard_workbook(full_path)
+                results.append(
+                    {
+                        "op": op_name,
+                        "status": "error",
+                        "message": f"{str(e)}; batch aborted, no changes saved",
+                    }
+                )
+                break
+    return _dumps(results)
+
+
+@tool(parse_docstring=True)
+@tool_errors(WorkbookError)
 def create_workbook(filepath: str) -> str:
     """Create new Excel workbook.
 
@@ -330,22 +583,13 @@ def create_workbook(filepath: str) -> str:
     Returns:
         Success message with created file path
     """
-    try:
-        full_path = get_excel_path(filepath)
-        from open_claude_for_excel.tools.workbook import (
-            create_workbook as create_workbook_impl,
-        )
-
-        create_workbook_impl(full_path)
-        return f"Created workbook at {full_path}"
-    except WorkbookError as e:
-        return f"Error: {str(e)}"
-    except Exception as e:
-        logger.error(f"Error creating workbook: {e}")
-        raise
+    full_path = get_excel_path(filepath)
+    create_workbook_impl(full_path)
+    return f"Created workbook at {full_path}"
 
 
 @tool(parse_docstring=True)
+@tool_errors(ValidationError, WorkbookError)
 def create_worksheet(filepath: str, sheet_name: str) -> str:
     """Create new worksheet in workbook.
 
@@ -356,22 +600,13 @@ def create_worksheet(filepath: str, sheet_name: str) -> str:
     Returns:
         Success message
     """
-    try:
-        full_path = get_excel_path(filepath)
-        from open_claude_for_excel.tools.workbook import (
-            create_sheet as create_worksheet_impl,
-        )
-
-        result = create_worksheet_impl(full_path, sheet_name)
-        return result["message"]
-    except (ValidationError, WorkbookError) as e:
-        return f"Error: {str(e)}"
-    except Exception as e:
-        logger.error(f"Error creating worksheet: {e}")
-        raise
+    full_path = get_excel_path(filepath)
+    result = create_worksheet_impl(full_path, sheet_name)
+    return result.message
 
 
 @tool(parse_docstring=True)
+@tool_errors(ValidationError, ChartError)
 def create_chart(
     filepath: str,
     sheet_name: str,
@@ -397,27 +632,22 @@ def create_chart(
     Returns:
         Success message
     """
-    try:
-        full_path = get_excel_path(filepath)
-        result = create_chart_impl(
-            filepath=full_path,
-            sheet_name=sheet_name,
-            data_range=data_range,
-            chart_type=chart_type,
-            target_cell=target_cell,
-            title=title,
-            x_axis=x_axis,
-            y_axis=y_axis,
-        )
-        return result["message"]
-    except (ValidationError, ChartError) as e:
-        return f"Error: {str(e)}"
-    except Exception as e:
-        logger.error(f"Error creating chart: {e}")
-        raise
+    full_path = get_excel_path(filepath)
+    result = create_chart_impl(
+        filepath=full_path,
+        sheet_name=sheet_name,
+        data_range=data_range,
+        chart_type=chart_type,
+        target_cell=target_cell,
+        title=title,
+        x_axis=x_axis,
+        y_axis=y_axis,
+    )
+    return result["message"]
 
 
 @tool(parse_docstring=True)
+@tool_errors(ValidationError, PivotError)
 def create_pivot_table(
     filepath: str,
     sheet_name: str,
@@ -441,26 +671,21 @@ def create_pivot_table(
     Returns:
         Success message
     """
-    try:
-        full_path = get_excel_path(filepath)
-        result = create_pivot_table_impl(
-            filepath=full_path,
-            sheet_name=sheet_name,
-            data_range=data_range,
-            rows=rows,
-            values=values,
-            columns=columns or [],
-            agg_func=agg_func,
-        )
-        return result["message"]
-    except (ValidationError, PivotError) as e:
-        return f"Error: {str(e)}"
-    except Exception as e:
-        logger.error(f"Error creating pivot table: {e}")
-        raise
+    full_path = get_excel_path(filepath)
+    result = create_pivot_table_impl(
+        filepath=full_path,
+        sheet_name=sheet_name,
+        data_range=data_range,
+        rows=rows,
+        values=values,
+        columns=columns or [],
+        agg_func=agg_func,
+    )
+    return result["message"]
 
 
 @tool(parse_docstring=True)
+@tool_errors(DataError)
 def create_table(
     filepath: str,
     sheet_name: str,
@@ -480,24 +705,19 @@ def create_table(
     Returns:
         Success message
     """
-    try:
-        full_path = get_excel_path(filepath)
-        result = create_table_impl(
-            filepath=full_path,
-            sheet_name=sheet_name,
-            data_range=data_range,
-            table_name=table_name,
-            table_style=table_style,
-        )
-        return result["message"]
-    except DataError as e:
-        return f"Error: {str(e)}"
-    except Exception as e:
-        logger.error(f"Error creating table: {e}")
-        raise
+    full_path = get_excel_path(filepath)
+    result = create_table_impl(
+        filepath=full_path,
+        sheet_name=sheet_name,
+        data_range=data_range,
+        table_name=table_name,
+        table_style=table_style,
+    )
+    return result["message"]
 
 
 @tool(parse_docstring=True)
+@tool_errors(ValidationError, SheetError)
 def copy_worksheet(filepath: str, source_sheet: str, target_sheet: str) -> str:
     """Copy worksheet within workbook.
 
@@ -509,18 +729,13 @@ def copy_worksheet(filepath: str, source_sheet: str, target_sheet: str) -> str:
     Returns:
         Success message
     """
-    try:
-        full_path = get_excel_path(filepath)
-        result = copy_sheet(full_path, source_sheet, target_sheet)
-        return result["message"]
-    except (ValidationError, SheetError) as e:
-        return f"Error: {str(e)}"
-    except Exception as e:
-        logger.error(f"Error copying worksheet: {e}")
-        raise
+    full_path = get_excel_path(filepath)
+    result = copy_sheet(full_path, source_sheet, target_sheet)
+    return result.message
 
 
 @tool(parse_docstring=True)
+@tool_errors(ValidationError, SheetError)
 def delete_worksheet(filepath: str, sheet_name: str) -> str:
     """Delete worksheet from workbook.
 
@@ -531,18 +746,13 @@ def delete_worksheet(filepath: str, sheet_name: str) -> str:
     Returns:
         Success message
     """
-    try:
-        full_path = get_excel_path(filepath)
-        result = delete_sheet(full_path, sheet_name)
-        return result["message"]
-    except (ValidationError, SheetError) as e:
-        return f"Error: {str(e)}"
-    except Exception as e:
-        logger.error(f"Error deleting worksheet: {e}")
-        raise
+    full_path = get_excel_path(filepath)
+    result = delete_sheet(full_path, sheet_name)
+    return result.message
 
 
 @tool(parse_docstring=True)
+@tool_errors(ValidationError, SheetError)
 def rename_worksheet(filepath: str, old_name: str, new_name: str) -> str:
     """Rename worksheet in workbook.
 
@@ -554,18 +764,13 @@ def rename_worksheet(filepath: str, old_name: str, new_name: str) -> str:
     Returns:
         Success message
     """
-    try:
-        full_path = get_excel_path(filepath)
-        result = rename_sheet(full_path, old_name, new_name)
-        return result["message"]
-    except (ValidationError, SheetError) as e:
-        return f"Error: {str(e)}"
-    except Exception as e:
-        logger.error(f"Error renaming worksheet: {e}")
-        raise
+    full_path = get_excel_path(filepath)
+    result = rename_sheet(full_path, old_name, new_name)
+    return result.message
 
 
 @tool(parse_docstring=True)
+@tool_errors(WorkbookError)
 def get_workbook_metadata(filepath: str, include_ranges: bool = False) -> str:
     """Get metadata about workbook including sheets, ranges, etc.
 
@@ -574,20 +779,15 @@ def get_workbook_metadata(filepath: str, include_ranges: bool = False) -> str:
         include_ranges: Whether to include range information
 
     Returns:
-        String representation of workbook metadata
+        JSON string of workbook metadata
     """
-    try:
-        full_path = get_excel_path(filepath)
-        result = get_workbook_info(full_path, include_ranges=include_ranges)
-        return str(result)
-    except WorkbookError as e:
-        return f"Error: {str(e)}"
-    except Exception as e:
-        logger.error(f"Error getting workbook metadata: {e}")
-        raise
+    full_path = get_excel_path(filepath)
+    result = get_workbook_info(full_path, include_ranges=include_ranges)
+    return _dumps(result)
 
 
 @tool(parse_docstring=True)
+@tool_errors(ValidationError, SheetError)
 def merge_cells(filepath: str, sheet_name: str, start_cell: str, end_cell: str) -> str:
     """Merge a range of cells.
 
@@ -600,18 +800,13 @@ def merge_cells(filepath: str, sheet_name: str, start_cell: str, end_cell: str)
     Returns:
         Success message
     """
-    try:
-        full_path = get_excel_path(filepath)
-        result = merge_range(full_path, sheet_name, start_cell, end_cell)
-        return result["message"]
-    except (ValidationError, SheetError) as e:
-        return f"Error: {str(e)}"
-    except Exception as e:
-        logger.error(f"Error merging cells: {e}")
-        raise
+    full_path = get_excel_path(filepath)
+    result = merge_range(full_path, sheet_name, start_cell, end_cell)
+    return result.message
 
 
 @tool(parse_docstring=True)
+@tool_errors(ValidationError, SheetError)
 def unmerge_cells(
     filepath: str, sheet_name: str, start_cell: str, end_cell: str
 ) -> str:
@@ -626,18 +821,13 @@ def unmerge_cells(
     Returns:
         Success message
     """
-    try:
-        full_path = get_excel_path(filepath)
-        result = unmerge_range(full_path, sheet_name, start_cell, end_cell)
-        return result["message"]
-    except (ValidationError, SheetError) as e:
-        return f"Error: {str(e)}"
-    except Exception as e:
-        logger.error(f"Error unmerging cells: {e}")
-        raise
+    full_path = get_excel_path(filepath)
+    result = unmerge_range(full_path, sheet_name, start_cell, end_cell)
+    return result.message
 
 
 @tool(parse_docstring=True)
+@tool_errors(ValidationError, SheetError)
 def get_merged_cells(filepath: str, sheet_name: str) -> str:
     """Get merged cells in a worksheet.
 
@@ -646,19 +836,14 @@ def get_merged_cells(filepath: str, sheet_name: str) -> str:
         sheet_name: Target worksheet name
 
     Returns:
-        String representation of merged cells
+        JSON string of merged cell ranges
     """
-    try:
-        full_path = get_excel_path(filepath)
-        return str(get_merged_ranges(full_path, sheet_name))
-    except (ValidationError, SheetError) as e:
-        return f"Error: {str(e)}"
-    except Exception as e:
-        logger.error(f"Error getting merged cells: {e}")
-        raise
+    full_path = get_excel_path(filepath)
+    return _dumps({"ranges": get_merged_ranges(full_path, sheet_name)})
 
 
 @tool(parse_docstring=True)
+@tool_errors(ValidationError, SheetError)
 def copy_range(
     filepath: str,
     sheet_name: str,
@@ -680,27 +865,20 @@ def copy_range(
     Returns:
         Success message
     """
-    try:
-        full_path = get_excel_path(filepath)
-        from open_claude_for_excel.tools.sheet import copy_range_operation
-
-        result = copy_range_operation(
-            full_path,
-            sheet_name,
-            source_start,
-            source_end,
-            target_start,
-            target_sheet or sheet_name,  # Use source sheet if target_sheet is None
-        )
-        return result["message"]
-    except (ValidationError, SheetError) as e:
-        return f"Error: {str(e)}"
-    except Exception as e:
-        logger.error(f"Error copying range: {e}")
-        raise
+    full_path = get_excel_path(filepath)
+    result = copy_range_operation(
+        full_path,
+        sheet_name,
+        source_start,
+        source_end,
+        target_start,
+        target_sheet or sheet_name,  # Use source sheet if target_sheet is None
+    )
+    return result.message
 
 
 @tool(parse_docstring=True)
+@tool_errors(ValidationError, SheetError)
 def delete_range(
     filepath: str,
     sheet_name: str,
@@ -720,22 +898,20 @@ def delete_range(
     Returns:
         Success message
     """
-    try:
-        full_path = get_excel_path(filepath)
-        from open_claude_for_excel.tools.sheet import delete_range_operation
+    full_path = get_excel_path(filepath)
+    result = delete_range_operation(
+        full_path, sheet_name, start_cell, end_cell, shift_direction
+    )
+    return result.message
 
-        result = delete_range_operation(
-            full_path, sheet_name, start_cell, end_cell, shift_direction
-        )
-        return result["message"]
-    except (ValidationError, SheetError) as e:
-        return f"Error: {str(e)}"
-    except Exception as e:
-        logger.error(f"Error deleting range: {e}")
-        raise
+
+# A1-style reference, optionally absolute and optionally a two-corner range.
+# Used to reject malformed input before paying for a workbook parse.
+_RANGE_RE = re.compile(r"^\$?[A-Z]{1,3}\$?\d+(?::\$?[A-Z]{1,3}\$?\d+)?$")
 
 
 @tool(parse_docstring=True)
+@tool_errors(ValidationError)
 def validate_excel_range(
     filepath: str, sheet_name: str, start_cell: str, end_cell: Optional[str] = None
 ) -> str:
@@ -750,19 +926,18 @@ def validate_excel_range(
     Returns:
         Success message
     """
-    try:
-        full_path = get_excel_path(filepath)
-        range_str = start_cell if not end_cell else f"{start_cell}:{end_cell}"
-        result = validate_range_impl(full_path, sheet_name, range_str)
-        return result["message"]
-    except ValidationError as e:
-        return f"Error: {str(e)}"
-    except Exception as e:
-        logger.error(f"Error validating range: {e}")
-        raise
+    full_path = get_excel_path(filepath)
+    range_str = start_cell if not end_cell else f"{start_cell}:{end_cell}"
+    # Malformed references can be rejected without touching disk; only a
+    # syntactically valid range needs the sheet for bounds checking.
+    if not _RANGE_RE.match(range_str.upper()):
+        return f"Error: Invalid range format: {range_str}"
+    result = validate_range_impl(full_path, sheet_name, range_str)
+    return result["message"]
 
 
 @tool(parse_docstring=True)
+@tool_errors()
 def get_data_validation_info(filepath: str, sheet_name: str) -> str:
     """Get all data validation rules in a worksheet. This tool helps identify which cell ranges have validation rules and what types of validation are applied.
 
@@ -773,39 +948,27 @@ def get_data_validation_info(filepath: str, sheet_name: str) -> str:
     Returns:
         JSON string containing all validation rules in the worksheet
     """
-    try:
-        full_path = get_excel_path(filepath)
-        from openpyxl import load_workbook
-
-        from open_claude_for_excel.tools.cell_validation import (
-            get_all_validation_ranges,
-        )
-
-        wb = load_workbook(full_path, read_only=False)
+    full_path = get_excel_path(filepath)
+    # The shared handle cache already serves this read without re-parsing
+    # the file. openpyxl's read_only mode would not help here even for the
+    # cold load: read-only worksheets expose no data_validations, and list
+    # validations may need cell values to resolve their source ranges.
+    with open_wb(full_path, mode="r") as wb:
         if sheet_name not in wb.sheetnames:
             return f"Error: Sheet '{sheet_name}' not found"
 
-        ws = wb[sheet_name]
-        validations = get_all_validation_ranges(ws)
-        wb.close()
+        validations = get_all_validation_ranges(wb[sheet_name])
 
-        if not validations:
-            return "No data validation rules found in this worksheet"
+    if not validations:
+        return "No data validation rules found in this worksheet"
 
-        import json
-
-        return json.dumps(
-            {"sheet_name": sheet_name, "validation_rules": validations},
-            indent=2,
-            default=str,
-        )
-
-    except Exception as e:
-        logger.error(f"Error getting validation info: {e}")
-        raise
+    return _dumps(
+        {"sheet_name": sheet_name, "validation_rules": validations}
+    )
 
 
 @tool(parse_docstring=True)
+@tool_errors(ValidationError, SheetError)
 def insert_rows(filepath: str, sheet_name: str, start_row: int, count: int = 1) -> str:
     """Insert one or more rows starting at the specified row.
 
@@ -818,18 +981,13 @@ def insert_rows(filepath: str, sheet_name: str, start_row: int, count: int = 1)
     Returns:
         Success message
     """
-    try:
-        full_path = get_excel_path(filepath)
-        result = insert_row(full_path, sheet_name, start_row, count)
-        return result["message"]
-    except (ValidationError, SheetError) as e:
-        return f"Error: {str(e)}"
-    except Exception as e:
-        logger.error(f"Error inserting rows: {e}")
-        raise
+    full_path = get_excel_path(filepath)
+    result = insert_row(full_path, sheet_name, start_row, count)
+    return result.message
 
 
 @tool(parse_docstring=True)
+@tool_errors(ValidationError, SheetError)
 def insert_columns(
     filepath: str, sheet_name: str, start_col: int, count: int = 1
 ) -> str:
@@ -844,18 +1002,13 @@ def insert_columns(
     Returns:
         Success message
     """
-    try:
-        full_path = get_excel_path(filepath)
-        result = insert_cols(full_path, sheet_name, start_col, count)
-        return result["message"]
-    except (ValidationError, SheetError) as e:
-        return f"Error: {str(e)}"
-    except Exception as e:
-        logger.error(f"Error inserting columns: {e}")
-        raise
+    full_path = get_excel_path(filepath)
+    result = insert_cols(full_path, sheet_name, start_col, count)
+    return result.message
 
 
 @tool(parse_docstring=True)
+@tool_errors(ValidationError, SheetError)
 def delete_sheet_rows(
     filepath: str, sheet_name: str, start_row: int, count: int = 1
 ) -> str:
@@ -870,18 +1023,13 @@ def delete_sheet_rows(
     Returns:
         Success message
     """
-    try:
-        full_path = get_excel_path(filepath)
-        result = delete_rows(full_path, sheet_name, start_row, count)
-        return result["message"]
-    except (ValidationError, SheetError) as e:
-        return f"Error: {str(e)}"
-    except Exception as e:
-        logger.error(f"Error deleting rows: {e}")
-        raise
+    full_path = get_excel_path(filepath)
+    result = delete_rows(full_path, sheet_name, start_row, count)
+    return result.message
 
 
 @tool(parse_docstring=True)
+@tool_errors(ValidationError, SheetError)
 def delete_sheet_columns(
     filepath: str, sheet_name: str, start_col: int, count: int = 1
 ) -> str:
@@ -896,12 +1044,6 @@ def delete_sheet_columns(
     Returns:
         Success message
     """
-    try:
-        full_path = get_excel_path(filepath)
-        result = delete_cols(full_path, sheet_name, start_col, count)
-        return result["message"]
-    except (ValidationError, SheetError) as e:
-        return f"Error: {str(e)}"
-    except Exception as e:
-        logger.error(f"Error deleting columns: {e}")
-        raise
+    full_path = get_excel_path(filepath)
+    result = delete_cols(full_path, sheet_name, start_col, count)
+    return result.message
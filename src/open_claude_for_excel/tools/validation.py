@@ -1,13 +1,14 @@
 import logging
 import re
+from functools import lru_cache
 from typing import Any
 
-from openpyxl import load_workbook
 from openpyxl.utils import get_column_letter
 from openpyxl.worksheet.worksheet import Worksheet
 
 from .cell_utils import parse_cell_range, validate_cell_reference
 from .exceptions import ValidationError
+from .workbook_cache import open_wb
 
 logger = logging.getLogger(__name__)
 
@@ -17,77 +18,77 @@ def validate_formula_in_cell_operation(
 ) -> dict[str, Any]:
     """Validate Excel formula before writing"""
     try:
-        wb = load_workbook(filepath)
-        if sheet_name not in wb.sheetnames:
-            raise ValidationError(f"Sheet '{sheet_name}' not found")
-
-        if not validate_cell_reference(cell):
-            raise ValidationError(f"Invalid cell reference: {cell}")
-
-        # First validate the provided formula's syntax
-        is_valid, message = validate_formula(formula)
-        if not is_valid:
-            raise ValidationError(f"Invalid formula syntax: {message}")
-
-        # Additional validation for cell references in formula
-        cell_refs = re.findall(r"[A-Z]+[0-9]+(?::[A-Z]+[0-9]+)?", formula)
-        for ref in cell_refs:
-            if ":" in ref:  # Range reference
-                start, end = ref.split(":")
-                if not (
-                    validate_cell_reference(start) and validate_cell_reference(end)
-                ):
-                    raise ValidationError(
-                        f"Invalid cell range reference in formula: {ref}"
-                    )
-            else:  # Single cell reference
-                if not validate_cell_reference(ref):
-                    raise ValidationError(f"Invalid cell reference in formula: {ref}")
-
-        # Now check if there's a formula in the cell and compare
-        sheet = wb[sheet_name]
-        cell_obj = sheet[cell]
-        current_formula = cell_obj.value
-
-        # If cell has a formula (starts with =)
-        if isinstance(current_formula, str) and current_formula.startswith("="):
-            if formula.startswith("="):
-                if current_formula != formula:
-                    return {
-                        "message": "Formula is valid but doesn't match cell content",
-                        "valid": True,
-                        "matches": False,
-                        "cell": cell,
-                        "provided_formula": formula,
-                        "current_formula": current_formula,
-                    }
-            else:
-                if current_formula != f"={formula}":
-                    return {
-                        "message": "Formula is valid but doesn't match cell content",
-                        "valid": True,
-                        "matches": False,
-                        "cell": cell,
-                        "provided_formula": formula,
-                        "current_formula": current_formula,
-                    }
+        with open_wb(filepath, mode="r") as wb:
+            if sheet_name not in wb.sheetnames:
+                raise ValidationError(f"Sheet '{sheet_name}' not found")
+
+            if not validate_cell_reference(cell):
+                raise ValidationError(f"Invalid cell reference: {cell}")
+
+            # First validate the provided formula's syntax
+            is_valid, message = validate_formula(formula)
+            if not is_valid:
+                raise ValidationError(f"Invalid formula syntax: {message}")
+
+            # Additional validation for cell references in formula
+            cell_refs = re.findall(r"[A-Z]+[0-9]+(?::[A-Z]+[0-9]+)?", formula)
+            for ref in cell_refs:
+                if ":" in ref:  # Range reference
+                    start, end = ref.split(":")
+                    if not (
+                        validate_cell_reference(start) and validate_cell_reference(end)
+                    ):
+                        raise ValidationError(
+                            f"Invalid cell range reference in formula: {ref}"
+                        )
+                else:  # Single cell reference
+                    if not validate_cell_reference(ref):
+                        raise ValidationError(f"Invalid cell reference in formula: {ref}")
+
+            # Now check if there's a formula in the cell and compare
+            sheet = wb[sheet_name]
+            cell_obj = sheet[cell]
+            current_formula = cell_obj.value
+
+            # If cell has a formula (starts with =)
+            if isinstance(current_formula, str) and current_formula.startswith("="):
+                if formula.startswith("="):
+                    if current_formula != formula:
+                        return {
+                            "message": "Formula is valid but doesn't match cell content",
+                            "valid": True,
+                            "matches": False,
+                            "cell": cell,
+                            "provided_formula": formula,
+                            "current_formula": current_formula,
+                        }
                 else:
-                    return {
-                        "message": "Formula is valid and matches cell content",
-                        "valid": True,
-                        "matches": True,
-                        "cell": cell,
-                        "formula": formula,
-                    }
-        else:
-            return {
-                "message": "Formula is valid but cell contains no formula",
-                "valid": True,
-                "matches": False,
-                "cell": cell,
-                "provided_formula": formula,
-                "current_content": str(current_formula) if current_formula else "",
-            }
+                    if current_formula != f"={formula}":
+                        return {
+                            "message": "Formula is valid but doesn't match cell content",
+                            "valid": True,
+                            "matches": False,
+                            "cell": cell,
+                            "provided_formula": formula,
+                            "current_formula": current_formula,
+                        }
+                    else:
+                        return {
+                            "message": "Formula is valid and matches cell content",
+                            "valid": True,
+                            "matches": True,
+                            "cell": cell,
+                            "formula": formula,
+                        }
+            else:
+                return {
+                    "message": "Formula is valid but cell contains no formula",
+                    "valid": True,
+                    "matches": False,
+                    "cell": cell,
+                    "provided_formula": formula,
+                    "current_content": str(current_formula) if current_formula else "",
+                }
 
     except ValidationError as e:
         logger.error(str(e))
@@ -105,58 +106,58 @@ def validate_range_in_sheet_operation(
 ) -> dict[str, Any]:
     """Validate if a range exists in a worksheet and return data range info."""
     try:
-        wb = load_workbook(filepath)
-        if sheet_name not in wb.sheetnames:
-            raise ValidationError(f"Sheet '{sheet_name}' not found")
+        with open_wb(filepath, mode="r") as wb:
+            if sheet_name not in wb.sheetnames:
+                raise ValidationError(f"Sheet '{sheet_name}' not found")
 
-        worksheet = wb[sheet_name]
+            worksheet = wb[sheet_name]
 
-        # Get actual data dimensions
-        data_max_row = worksheet.max_row
-        data_max_col = worksheet.max_column
+            # Get actual data dimensions
+            data_max_row = worksheet.max_row
+            data_max_col = worksheet.max_column
 
-        # Validate range
-        try:
-            start_row, start_col, end_row, end_col = parse_cell_range(
-                start_cell, end_cell
+            # Validate range
+            try:
+                start_row, start_col, end_row, end_col = parse_cell_range(
+                    start_cell, end_cell
+                )
+            except ValueError as e:
+                raise ValidationError(f"Invalid range: {str(e)}")
+
+            # If end not specified, use start
+            if end_row is None:
+                end_row = start_row
+            if end_col is None:
+                end_col = start_col
+
+            # Validate bounds against maximum possible Excel limits
+            is_valid, message = validate_range_bounds(
+                worksheet, start_row, start_col, end_row, end_col
             )
-        except ValueError as e:
-            raise ValidationError(f"Invalid range: {str(e)}")
-
-        # If end not specified, use start
-        if end_row is None:
-            end_row = start_row
-        if end_col is None:
-            end_col = start_col
-
-        # Validate bounds against maximum possible Excel limits
-        is_valid, message = validate_range_bounds(
-            worksheet, start_row, start_col, end_row, end_col
-        )
-        if not is_valid:
-            raise ValidationError(message)
-
-        range_str = f"{start_cell}" if end_cell is None else f"{start_cell}:{end_cell}"
-        data_range_str = f"A1:{get_column_letter(data_max_col)}{data_max_row}"
-
-        # Check if range is within data or extends beyond
-        extends_beyond_data = end_row > data_max_row or end_col > data_max_col
-
-        return {
-            "message": (
-                f"Range '{range_str}' is valid. "
-                f"Sheet contains data in range '{data_range_str}'"
-            ),
-            "valid": True,
-            "range": range_str,
-            "data_range": data_range_str,
-            "extends_beyond_data": extends_beyond_data,
-            "data_dimensions": {
-                "max_row": data_max_row,
-                "max_col": data_max_col,
-                "max_col_letter": get_column_letter(data_max_col),
-            },
-        }
+            if not is_valid:
+                raise ValidationError(message)
+
+            range_str = f"{start_cell}" if end_cell is None else f"{start_cell}:{end_cell}"
+            data_range_str = f"A1:{get_column_letter(data_max_col)}{data_max_row}"
+
+            # Check if range is within data or extends beyond
+            extends_beyond_data = end_row > data_max_row or end_col > data_max_col
+
+            return {
+                "message": (
+                    f"Range '{range_str}' is valid. "
+                    f"Sheet contains data in range '{data_range_str}'"
+                ),
+                "valid": True,
+                "range": range_str,
+                "data_range": data_range_str,
+                "extends_beyond_data": extends_beyond_data,
+                "data_dimensions": {
+                    "max_row": data_max_row,
+                    "max_col": data_max_col,
+                    "max_col_letter": get_column_letter(data_max_col),
+                },
+            }
     except ValidationError as e:
         logger.error(str(e))
         raise
@@ -165,6 +166,37 @@ def validate_range_in_sheet_operation(
         raise ValidationError(str(e))
 
 
+_FORMULA_CELL_REF_RE = re.compile(r"[A-Z]+[0-9]+(?::[A-Z]+[0-9]+)?")
+
+
+def validate_formula_syntax_only(cell: str, formula: str) -> dict[str, Any]:
+    """Validate a cell reference and formula purely syntactically.
+
+    Covers everything validate_formula_in_cell_operation checks except the
+    comparison against the cell's current content, and therefore needs no
+    workbook access at all. Raises ValidationError on syntax problems just
+    like the workbook-backed path.
+    """
+    if not validate_cell_reference(cell):
+        raise ValidationError(f"Invalid cell reference: {cell}")
+
+    is_valid, message = validate_formula(formula)
+    if not is_valid:
+        raise ValidationError(f"Invalid formula syntax: {message}")
+
+    # Additional validation for cell references in formula
+    for ref in _FORMULA_CELL_REF_RE.findall(formula):
+        if ":" in ref:  # Range reference
+            start, end = ref.split(":")
+            if not (validate_cell_reference(start) and validate_cell_reference(end)):
+                raise ValidationError(f"Invalid cell range reference in formula: {ref}")
+        elif not validate_cell_reference(ref):  # Single cell reference
+            raise ValidationError(f"Invalid cell reference in formula: {ref}")
+
+    return {"message": "Formula syntax is valid", "valid": True, "cell": cell}
+
+
+@lru_cache(maxsize=4096)
 def validate_formula(formula: str) -> tuple[bool, str]:
     """Validate Excel formula syntax and safety"""
     if not formula.startswith("="):
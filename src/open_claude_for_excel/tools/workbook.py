@@ -5,7 +5,9 @@ from typing import Any
 from openpyxl import Workbook, load_workbook
 from openpyxl.utils import get_column_letter
 
+from ._result import ToolResult
 from .exceptions import WorkbookError
+from .workbook_cache import open_wb, register_workbook
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +26,8 @@ def create_workbook(filepath: str, sheet_name: str = "Sheet1") -> dict[str, Any]
         path = Path(filepath)
         path.parent.mkdir(parents=True, exist_ok=True)
         wb.save(str(path))
+        # Seed the handle cache so follow-up operations skip the reparse.
+        register_workbook(path, wb)
         return {
             "message": f"Created workbook: {filepath}",
             "active_sheet": sheet_name,
@@ -42,20 +46,17 @@ def get_or_create_workbook(filepath: str) -> Workbook:
         return create_workbook(filepath)["workbook"]
 
 
-def create_sheet(filepath: str, sheet_name: str) -> dict:
+def create_sheet(filepath: str, sheet_name: str) -> ToolResult:
     """Create a new worksheet in the workbook if it doesn't exist."""
     try:
-        wb = load_workbook(filepath)
+        with open_wb(filepath) as wb:
+            # Check if sheet already exists
+            if sheet_name in wb.sheetnames:
+                raise WorkbookError(f"Sheet {sheet_name} already exists")
 
-        # Check if sheet already exists
-        if sheet_name in wb.sheetnames:
-            raise WorkbookError(f"Sheet {sheet_name} already exists")
-
-        # Create new sheet
-        wb.create_sheet(sheet_name)
-        wb.save(filepath)
-        wb.close()
-        return {"message": f"Sheet {sheet_name} created successfully"}
+            # Create new sheet
+            wb.create_sheet(sheet_name)
+        return ToolResult(f"Sheet {sheet_name} created successfully")
     except WorkbookError as e:
         logger.error(str(e))
         raise
@@ -71,28 +72,27 @@ def get_workbook_info(filepath: str, include_ranges: bool = False) -> dict[str,
         if not path.exists():
             raise WorkbookError(f"File not found: {filepath}")
 
-        wb = load_workbook(filepath, read_only=False)
-
-        info = {
-            "filename": path.name,
-            "sheets": wb.sheetnames,
-            "size": path.stat().st_size,
-            "modified": path.stat().st_mtime,
-        }
-
-        if include_ranges:
-            # Add used ranges for each sheet
-            ranges = {}
-            for sheet_name in wb.sheetnames:
-                ws = wb[sheet_name]
-                if ws.max_row > 0 and ws.max_column > 0:
-                    ranges[sheet_name] = (
-                        f"A1:{get_column_letter(ws.max_column)}{ws.max_row}"
-                    )
-            info["used_ranges"] = ranges
-
-        wb.close()
-        return info
+        with open_wb(filepath, mode="r") as wb:
+
+            info = {
+                "filename": path.name,
+                "sheets": wb.sheetnames,
+                "size": path.stat().st_size,
+                "modified": path.stat().st_mtime,
+            }
+
+            if include_ranges:
+                # Add used ranges for each sheet
+                ranges = {}
+                for sheet_name in wb.sheetnames:
+                    ws = wb[sheet_name]
+                    if ws.max_row > 0 and ws.max_column > 0:
+                        ranges[sheet_name] = (
+                            f"A1:{get_column_letter(ws.max_column)}{ws.max_row}"
+                        )
+                info["used_ranges"] = ranges
+
+            return info
 
     except WorkbookError as e:
         logger.error(str(e))
@@ -0,0 +1,311 @@
+import atexit
+import logging
+import os
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Optional
+
+from openpyxl import Workbook, load_workbook
+
+from ._writer import flush_all, schedule_save
+from .exceptions import WorkbookError
+
+logger = logging.getLogger(__name__)
+
+# Maximum number of parsed workbooks kept in memory. openpyxl workbooks can
+# be an order of magnitude larger than the file on disk, so keep this small.
+MAX_CACHED_WORKBOOKS = 16
+
+
+@dataclass
+class _CacheEntry:
+    wb: Workbook
+    mtime_ns: Optional[int]  # None until the workbook is first saved to disk
+    dirty: bool = False
+    # Saves handed to the background writer but not yet confirmed on disk.
+    # While nonzero the entry is authoritative: the on-disk file and its
+    # mtime are about to change, so it must not be revalidated or evicted.
+    in_flight: int = 0
+    # Set (never cleared) when the entry is removed from the cache. A
+    # thread that fetched the entry earlier and was blocked on its lock
+    # must not proceed on the orphan — it may hold discarded partial
+    # mutations — so _acquire_entry rechecks this after taking the lock
+    # and re-fetches a fresh entry.
+    invalid: bool = False
+    lock: threading.RLock = field(default_factory=threading.RLock)
+
+
+_cache_lock = threading.RLock()
+_entries: dict[str, _CacheEntry] = {}
+
+# Paths whose per-operation flushes are currently suppressed by defer_saves.
+_deferred_paths: set[str] = set()
+
+# Background saves that failed, keyed by path. Collected on the writer
+# thread and raised at the next flush_workbooks() barrier for the path,
+# so a failed write surfaces to a caller instead of vanishing in the log.
+_save_errors: dict[str, Exception] = {}
+
+
+def _current_mtime_ns(path: str) -> Optional[int]:
+    try:
+        return os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+def _evict_clean_entries() -> None:
+    """Drop oldest clean entries above the cache limit (lock held)."""
+    while len(_entries) > MAX_CACHED_WORKBOOKS:
+        for path, entry in _entries.items():
+            if not entry.dirty and not entry.in_flight:
+                entry.invalid = True
+                del _entries[path]
+                break
+        else:
+            # Everything is dirty or mid-save; keep the entries until the
+            # writes have landed.
+            break
+
+
+def _get_entry(path: str, create: bool = False) -> _CacheEntry:
+    with _cache_lock:
+        mtime_ns = _current_mtime_ns(path)
+        entry = _entries.get(path)
+        if entry is not None:
+            # Dirty or mid-save entries are authoritative (an mtime change
+            # may be our own write landing, or the file may be mid-replace);
+            # clean ones are dropped when the file changed behind our back.
+            if entry.dirty or entry.in_flight or entry.mtime_ns == mtime_ns:
+                return entry
+            entry.invalid = True
+            del _entries[path]
+
+        if mtime_ns is None and create:
+            wb = Workbook()
+            # Match create_workbook's default sheet naming.
+            if "Sheet" in wb.sheetnames:
+                wb["Sheet"].title = "Sheet1"
+        else:
+            # Raises the usual load errors when the file is missing.
+            wb = load_workbook(path, read_only=False)
+        entry = _CacheEntry(wb=wb, mtime_ns=mtime_ns)
+        _entries[path] = entry
+        _evict_clean_entries()
+        return entry
+
+
+def _acquire_entry(path: str, create: bool) -> _CacheEntry:
+    """Fetch and lock the entry for path, retrying when it was discarded.
+
+    Another thread can discard an entry (rollback, batch abort, eviction)
+    while we are blocked on its lock; its workbook may then contain
+    mutations that were rolled back and must never be observed or saved.
+    Validity is therefore rechecked after the lock is held, and a stale
+    entry is released in favor of a fresh fetch.
+    """
+    while True:
+        entry = _get_entry(path, create=create)
+        entry.lock.acquire()
+        if not entry.invalid:
+            return entry
+        entry.lock.release()
+
+
+def _flush_entry(path: str, entry: _CacheEntry) -> None:
+    with entry.lock:
+        # A concurrent discard means the dirty state was rolled back;
+        # saving the orphan would resurrect the discarded mutations.
+        if entry.invalid or not entry.dirty:
+            return
+        parent = os.path.dirname(path)
+        if parent:
+            os.makedirs(parent, exist_ok=True)
+
+        def _note_written() -> None:
+            # Runs on the writer thread once the bytes are on disk, so the
+            # next mtime check recognizes our own write instead of treating
+            # it as an external change. Only then does the entry stop
+            # counting as in flight.
+            with _cache_lock:
+                entry.mtime_ns = _current_mtime_ns(path)
+                entry.in_flight -= 1
+
+        def _note_failed(exc: Exception) -> None:
+            # The snapshot never reached disk: re-mark the entry dirty so
+            # the next flush retries the save, and record the failure so
+            # the next flush_workbooks() barrier raises it instead of
+            # reporting success over silently lost data.
+            with _cache_lock:
+                entry.in_flight -= 1
+                entry.dirty = True
+                _save_errors[path] = exc
+
+        # Snapshot to memory here (mutation-consistent) and let the
+        # background writer take the disk latency off the critical path.
+        with _cache_lock:
+            entry.in_flight += 1
+        schedule_save(path, entry.wb, on_written=_note_written, on_error=_note_failed)
+        entry.dirty = False
+
+
+@contextmanager
+def open_wb(path, mode: str = "rw", create: bool = False):
+    """Borrow the cached parsed workbook for a path.
+
+    Repeated tool calls against the same file skip the full XLSX parse,
+    which dominates their runtime. Mode "r" yields the shared workbook for
+    reading only. Mode "rw" additionally marks it dirty and flushes it back
+    to disk when the block exits cleanly; if the block raises, the entry is
+    discarded instead so a half-mutated workbook can never be observed or
+    saved. With create=True a new workbook is started when the file does
+    not exist yet.
+
+    Access to one workbook is serialized with a per-path lock for readers
+    and writers alike: openpyxl reads are not passive (ws.cell() inserts
+    missing cells into the shared worksheet), so a read racing a mutation
+    would corrupt shared state just as two mutations would.
+    """
+    path = os.fspath(path)
+    entry = _acquire_entry(path, create)
+    try:
+        try:
+            yield entry.wb
+        except BaseException:
+            if "w" in mode:
+                # Poison the entry before dropping it so threads already
+                # waiting on its lock re-fetch instead of proceeding on
+                # the half-mutated workbook.
+                with _cache_lock:
+                    entry.invalid = True
+                    if _entries.get(path) is entry:
+                        del _entries[path]
+            raise
+        if "w" in mode:
+            entry.dirty = True
+    finally:
+        entry.lock.release()
+    if "w" in mode and path not in _deferred_paths:
+        _flush_entry(path, entry)
+
+
+@contextmanager
+def defer_saves(path):
+    """Coalesce the flushes of several open_wb blocks into one save.
+
+    While active, mutating blocks against the path mark the cached
+    workbook dirty but skip the per-operation flush; the workbook is
+    written once when the context exits. If a block raised and discarded
+    the entry, the deferred (unsaved) mutations are dropped with it and
+    the on-disk file is left as it was before the batch.
+    """
+    path = os.fspath(path)
+    with _cache_lock:
+        _deferred_paths.add(path)
+    try:
+        yield
+    finally:
+        with _cache_lock:
+            _deferred_paths.discard(path)
+        flush_workbooks(path)
+
+
+def saves_deferred(path) -> bool:
+    """Whether a defer_saves block is currently active for path."""
+    path = os.fspath(path)
+    with _cache_lock:
+        return path in _deferred_paths
+
+
+def discard_workbook(path) -> None:
+    """Drop the cached entry for path without saving its changes.
+
+    Rollback primitive for batches: unsaved mutations die with the entry
+    and the next borrow reloads the workbook from disk, so the on-disk
+    state wins. Saves already handed to the background writer are not
+    affected.
+    """
+    path = os.fspath(path)
+    with _cache_lock:
+        entry = _entries.pop(path, None)
+        if entry is not None:
+            entry.invalid = True
+
+
+def pending_writes(path) -> bool:
+    """Whether path has cached changes not yet confirmed on disk.
+
+    True from the moment a borrowed workbook is returned dirty until the
+    background writer has written the bytes and refreshed the entry's
+    mtime. Callers keying caches on the on-disk mtime should bypass their
+    cache while this holds.
+    """
+    path = os.fspath(path)
+    with _cache_lock:
+        entry = _entries.get(path)
+        return entry is not None and (entry.dirty or entry.in_flight > 0)
+
+
+def register_workbook(path, wb: Workbook) -> None:
+    """Adopt an externally created workbook that was just saved to path."""
+    path = os.fspath(path)
+    with _cache_lock:
+        _entries[path] = _CacheEntry(wb=wb, mtime_ns=_current_mtime_ns(path))
+        _evict_clean_entries()
+
+
+def flush_workbooks(path=None) -> None:
+    """Write dirty cached workbooks back to disk.
+
+    Flushes a single path when given, every dirty entry otherwise. Acts as
+    the correctness barrier for deferred saves and is registered atexit.
+    Raises WorkbookError when a background save of a covered path failed;
+    the failed data stays dirty in the cache and is retried by the next
+    flush.
+    """
+    with _cache_lock:
+        if path is not None:
+            items = [(os.fspath(path), _entries.get(os.fspath(path)))]
+        else:
+            items = list(_entries.items())
+    for entry_path, entry in items:
+        if entry is not None:
+            _flush_entry(entry_path, entry)
+    # Barrier: wait for the background writer so callers can rely on the
+    # on-disk files being current.
+    flush_all()
+    with _cache_lock:
+        if path is not None:
+            flushed = os.fspath(path)
+            errors = (
+                {flushed: _save_errors.pop(flushed)} if flushed in _save_errors else {}
+            )
+        else:
+            errors = dict(_save_errors)
+            _save_errors.clear()
+    if errors:
+        exc = next(iter(errors.values()))
+        raise WorkbookError(
+            f"Background save failed for {', '.join(errors)}: {exc}"
+        ) from exc
+
+
+def clear_workbook_cache() -> None:
+    """Flush dirty workbooks and drop all cached entries."""
+    flush_workbooks()
+    with _cache_lock:
+        for entry in _entries.values():
+            entry.invalid = True
+        _entries.clear()
+
+
+def _flush_at_exit() -> None:
+    try:
+        flush_workbooks()
+    except WorkbookError:
+        # Nothing can be retried this late; the failure is already logged.
+        logger.exception("Final workbook flush failed")
+
+
+atexit.register(_flush_at_exit)